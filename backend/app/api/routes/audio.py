@@ -1,11 +1,15 @@
 """Audio steganography endpoints."""
 
-from base64 import b64encode
 from pathlib import Path
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+import orjson
+from pybase64 import b64encode
 
 from app.core.config import Settings, get_settings
+from app.core.responses import ORJSONResponse
 from app.models.schemas import (
     AudioAction,
     AudioFeature,
@@ -20,79 +24,102 @@ from app.services import audio_steganography, security
 router = APIRouter()
 
 
-@router.get("/overview", response_model=AudioOverview)
-async def audio_overview() -> AudioOverview:
-    """Provide static marketing content for the audio suite."""
-
-    return AudioOverview(
-        hero_title="Audio Steganography",
-        hero_subtitle=(
-            "Professional-grade audio steganography tools with minimalistic design. "
-            "Hide and reveal messages in audio files with precision and elegance."
+# The overview is trusted static content: build it without validation and serialize it once at import time.
+_OVERVIEW = AudioOverview.model_construct(
+    hero_title="Audio Steganography",
+    hero_subtitle=(
+        "Professional-grade audio steganography tools with minimalistic design. "
+        "Hide and reveal messages in audio files with precision and elegance."
+    ),
+    features=[
+        AudioFeature.model_construct(
+            title="WAV Support",
+            description="Optimized for 16-bit PCM WAV files to preserve fidelity while embedding data.",
         ),
-        features=[
-            AudioFeature(
-                title="WAV Support",
-                description="Optimized for 16-bit PCM WAV files to preserve fidelity while embedding data.",
-            ),
-            AudioFeature(
-                title="Visual Feedback",
-                description="Waveform snapshots reveal how the embedded payload affects the signal envelope.",
-            ),
-            AudioFeature(
-                title="Advanced Detection",
-                description="LSB heuristics estimate tampering risk while maintaining performance for instant analysis.",
-            ),
-        ],
-        actions=[
-            AudioAction(
-                title="Hide in Audio",
-                description="Embed secret messages into audio files with precision.",
-                cta="Get Started",
-            ),
-            AudioAction(
-                title="Retrieve from Audio",
-                description="Extract hidden messages from audio steganography.",
-                cta="Get Started",
-            ),
-            AudioAction(
-                title="Detect in Audio",
-                description="Analyze audio files for potential steganography.",
-                cta="Get Started",
-            ),
-        ],
-        narrative=(
-            "Audio steganography uses sophisticated algorithms to embed data in the least significant bits of "
-            "audio samples, making changes imperceptible to human hearing while maintaining file integrity."
+        AudioFeature.model_construct(
+            title="Visual Feedback",
+            description="Waveform snapshots reveal how the embedded payload affects the signal envelope.",
         ),
-    )
+        AudioFeature.model_construct(
+            title="Advanced Detection",
+            description="LSB heuristics estimate tampering risk while maintaining performance for instant analysis.",
+        ),
+    ],
+    actions=[
+        AudioAction.model_construct(
+            title="Hide in Audio",
+            description="Embed secret messages into audio files with precision.",
+            cta="Get Started",
+        ),
+        AudioAction.model_construct(
+            title="Retrieve from Audio",
+            description="Extract hidden messages from audio steganography.",
+            cta="Get Started",
+        ),
+        AudioAction.model_construct(
+            title="Detect in Audio",
+            description="Analyze audio files for potential steganography.",
+            cta="Get Started",
+        ),
+    ],
+    narrative=(
+        "Audio steganography uses sophisticated algorithms to embed data in the least significant bits of "
+        "audio samples, making changes imperceptible to human hearing while maintaining file integrity."
+    ),
+)
+_OVERVIEW_JSON = orjson.dumps(_OVERVIEW.model_dump())
 
 
-@router.post("/hide", response_model=StegoResponse)
-async def hide_message_in_audio(
-    file: UploadFile = File(...),
-    message: str = Form(...),
-    passphrase: str | None = Form(None),
-    settings: Settings = Depends(get_settings),
-) -> StegoResponse:
-    """Embed a secret message inside a WAV file."""
+@router.get("/overview", response_model=AudioOverview)
+async def audio_overview() -> Response:
+    """Provide static marketing content for the audio suite."""
+
+    return Response(content=_OVERVIEW_JSON, media_type="application/json")
+
 
+async def _embed_upload(file: UploadFile, message: str, passphrase: str | None, settings: Settings) -> bytes:
     payload = message.encode("utf-8")
     if len(payload) > settings.max_message_bytes:
         raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Message exceeds configured limit")
 
-    content = await file.read()
     if passphrase:
-        payload = security.encrypt_message(payload, passphrase)
+        payload = await run_in_threadpool(security.encrypt_message, payload, passphrase)
 
     try:
-        output_bytes = audio_steganography.embed_message(content, payload)
+        return await run_in_threadpool(audio_steganography.embed_message, file.file, payload)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
+
+@router.post("/hide", responses={200: {"model": StegoResponse}})
+async def hide_message_in_audio(
+    file: UploadFile = File(...),
+    message: str = Form(...),
+    passphrase: str | None = Form(None),
+    settings: Settings = Depends(get_settings),
+) -> ORJSONResponse:
+    """Embed a secret message inside a WAV file."""
+
+    output_bytes = await _embed_upload(file, message, passphrase, settings)
     filename = f"{Path(file.filename or 'audio').stem}_stego.wav"
     encoded = b64encode(output_bytes).decode("ascii")
-    return StegoResponse(filename=filename, media_type="audio/wav", data=encoded)
+    # Built by hand: the base64 body can be megabytes and needs no revalidation on the way out.
+    return ORJSONResponse({"filename": filename, "media_type": "audio/wav", "data": encoded})
+
+
+@router.post("/hide/raw", response_class=Response, responses={200: {"content": {"audio/wav": {}}}})
+async def hide_message_in_audio_raw(
+    file: UploadFile = File(...),
+    message: str = Form(...),
+    passphrase: str | None = Form(None),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    """Embed a secret message inside a WAV file and return the stego file as raw bytes."""
+
+    output_bytes = await _embed_upload(file, message, passphrase, settings)
+    filename = f"{Path(file.filename or 'audio').stem}_stego.wav"
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    return Response(content=output_bytes, media_type="audio/wav", headers=headers)
 
 
 @router.post("/retrieve", response_model=MessageResponse)
@@ -102,16 +129,14 @@ async def retrieve_message_from_audio(
 ) -> MessageResponse:
     """Extract a hidden message from a WAV file."""
 
-    content = await file.read()
-
     try:
-        payload = audio_steganography.extract_message(content)
+        payload = await run_in_threadpool(audio_steganography.extract_message, file.file)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     if passphrase:
         try:
-            payload = security.decrypt_message(payload, passphrase)
+            payload = await run_in_threadpool(security.decrypt_message, payload, passphrase)
         except ValueError as exc:  # pragma: no cover - fast path for user feedback
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -126,38 +151,42 @@ async def detect_audio_steganography(
 ) -> DetectionResponse:
     """Check whether a WAV signal likely contains embedded data."""
 
-    content = await file.read()
     try:
-        analysis = audio_steganography.estimate_steganography_probability(content, sample_size=settings.detection_sample_size)
+        analysis = await run_in_threadpool(audio_steganography.estimate_steganography_probability, file.file, sample_size=settings.detection_sample_size)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     suspected = analysis["probability"] >= 0.65
     return DetectionResponse(suspected=suspected, confidence=analysis["probability"], details=analysis)
 
 
-@router.post("/suite/embed", response_model=AudioSuiteResponse)
+@router.post("/suite/embed", responses={200: {"model": AudioSuiteResponse}})
 async def audio_suite_embed(
     file: UploadFile = File(...),
     message: str = Form(...),
     passphrase: str | None = Form(None),
     settings: Settings = Depends(get_settings),
-) -> AudioSuiteResponse:
+) -> ORJSONResponse:
     """Embed data and return waveform insights for advanced tooling."""
 
     payload = message.encode("utf-8")
     if len(payload) > settings.max_message_bytes:
         raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Message exceeds configured limit")
 
-    content = await file.read()
     if passphrase:
-        payload = security.encrypt_message(payload, passphrase)
+        payload = await run_in_threadpool(security.encrypt_message, payload, passphrase)
 
     try:
-        result = audio_steganography.embed_with_waveform(content, payload)
+        result = await run_in_threadpool(audio_steganography.embed_with_waveform, file.file, payload)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     encoded = b64encode(result["audio"].getvalue()).decode("ascii")
     filename = f"{Path(file.filename or 'audio').stem}_stego.wav"
-    stego = StegoResponse(filename=filename, media_type="audio/wav", data=encoded)
-    return AudioSuiteResponse(stego=stego, waveform=result["waveform"])
+    waveform = result["waveform"]
+    return ORJSONResponse(
+        {
+            "stego": {"filename": filename, "media_type": "audio/wav", "data": encoded},
+            "waveform_positions": waveform["positions"],
+            "waveform_amplitudes": waveform["amplitudes"],
+        }
+    )
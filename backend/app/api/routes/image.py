@@ -1,42 +1,63 @@
 """Image steganography endpoints."""
 
-from base64 import b64encode
 from pathlib import Path
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pybase64 import b64encode
 
 from app.core.config import Settings, get_settings
+from app.core.responses import ORJSONResponse
 from app.models.schemas import DetectionResponse, MessageResponse, StegoResponse
 from app.services import image_steganography, security
 
 router = APIRouter()
 
 
-@router.post("/hide", response_model=StegoResponse)
-async def hide_message_in_image(
-    file: UploadFile = File(...),
-    message: str = Form(...),
-    passphrase: str | None = Form(None),
-    settings: Settings = Depends(get_settings),
-) -> StegoResponse:
-    """Embed a secret message inside an image."""
-
+async def _embed_upload(file: UploadFile, message: str, passphrase: str | None, settings: Settings) -> bytes:
     payload = message.encode("utf-8")
     if len(payload) > settings.max_message_bytes:
         raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Message exceeds configured limit")
 
-    content = await file.read()
     if passphrase:
-        payload = security.encrypt_message(payload, passphrase)
+        payload = await run_in_threadpool(security.encrypt_message, payload, passphrase)
 
     try:
-        output_bytes = image_steganography.embed_message(content, payload)
+        return await run_in_threadpool(image_steganography.embed_message, file.file, payload)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
+
+@router.post("/hide", responses={200: {"model": StegoResponse}})
+async def hide_message_in_image(
+    file: UploadFile = File(...),
+    message: str = Form(...),
+    passphrase: str | None = Form(None),
+    settings: Settings = Depends(get_settings),
+) -> ORJSONResponse:
+    """Embed a secret message inside an image."""
+
+    output_bytes = await _embed_upload(file, message, passphrase, settings)
     filename = f"{Path(file.filename or 'image').stem}_stego.png"
     encoded = b64encode(output_bytes).decode("ascii")
-    return StegoResponse(filename=filename, media_type="image/png", data=encoded)
+    # Built by hand: the base64 body can be megabytes and needs no revalidation on the way out.
+    return ORJSONResponse({"filename": filename, "media_type": "image/png", "data": encoded})
+
+
+@router.post("/hide/raw", response_class=Response, responses={200: {"content": {"image/png": {}}}})
+async def hide_message_in_image_raw(
+    file: UploadFile = File(...),
+    message: str = Form(...),
+    passphrase: str | None = Form(None),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    """Embed a secret message inside an image and return the stego file as raw bytes."""
+
+    output_bytes = await _embed_upload(file, message, passphrase, settings)
+    filename = f"{Path(file.filename or 'image').stem}_stego.png"
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    return Response(content=output_bytes, media_type="image/png", headers=headers)
 
 
 @router.post("/retrieve", response_model=MessageResponse)
@@ -46,16 +67,14 @@ async def retrieve_message_from_image(
 ) -> MessageResponse:
     """Extract a hidden message from a stego image."""
 
-    content = await file.read()
-
     try:
-        payload = image_steganography.extract_message(content)
+        payload = await run_in_threadpool(image_steganography.extract_message, file.file)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     if passphrase:
         try:
-            payload = security.decrypt_message(payload, passphrase)
+            payload = await run_in_threadpool(security.decrypt_message, payload, passphrase)
         except ValueError as exc:  # pragma: no cover - fast path for user feedback
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -70,9 +89,8 @@ async def detect_image_steganography(
 ) -> DetectionResponse:
     """Provide a lightweight signal on hidden data risk."""
 
-    content = await file.read()
     try:
-        analysis = image_steganography.estimate_steganography_probability(content, sample_size=settings.detection_sample_size)
+        analysis = await run_in_threadpool(image_steganography.estimate_steganography_probability, file.file, sample_size=settings.detection_sample_size)
     except ValueError as exc:  # pragma: no cover - fast path for user feedback
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     suspected = analysis["probability"] >= 0.65
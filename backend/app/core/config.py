@@ -1,6 +1,5 @@
 """Application configuration settings."""
 
-from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -12,6 +11,8 @@ class Settings(BaseSettings):
     api_prefix: str = "/api/v1"
     default_passphrase: str | None = None
     max_message_bytes: int = Field(default=512 * 1024, description="Upper bound for messages in bytes")
+    max_upload_bytes: int = Field(default=64 * 1024 * 1024, description="Upper bound for uploaded carrier files in bytes")
+    worker_threads: int = Field(default=64, description="Size of the thread pool used for CPU-bound embedding work")
     detection_sample_size: int = Field(default=50_000, description="Number of samples to inspect during detection")
     allowed_origins: list[str] = Field(
         default_factory=lambda: ["http://127.0.0.1:5173", "http://localhost:5173"],
@@ -28,8 +29,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-@lru_cache
+# Built eagerly so the per-request ``Depends(get_settings)`` is a plain attribute read.
+_SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Provide a cached Settings instance."""
+    """Provide the process-wide Settings instance."""
 
-    return Settings()
+    return _SETTINGS
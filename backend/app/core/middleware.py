@@ -0,0 +1,56 @@
+"""ASGI middleware for request hygiene."""
+
+import logging
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_TOO_LARGE_DETAIL = "Request body exceeds configured limit"
+
+
+def _log_rejection(scope: Scope, size: int, limit: int) -> None:
+    logger.warning(
+        "Rejected request body on %s: %d bytes exceeds %d byte limit",
+        scope["path"],
+        size,
+        limit,
+    )
+
+
+class MaxBodySizeMiddleware:
+    """Reject request bodies larger than ``max_bytes`` before they are buffered."""
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    _log_rejection(scope, int(value), self.max_bytes)
+                    response = JSONResponse({"detail": _TOO_LARGE_DETAIL}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    _log_rejection(scope, received, self.max_bytes)
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
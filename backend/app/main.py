@@ -1,17 +1,32 @@
 """StegoVision backend application entrypoint."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import api_router
 from app.core.config import get_settings
+from app.core.middleware import MaxBodySizeMiddleware
+from app.core.responses import ORJSONResponse
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Embedding, extraction and key derivation run in the threadpool; size it for concurrent uploads.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = get_settings().worker_threads
+    yield
 
 
 def create_app() -> FastAPI:
     """Build the FastAPI application."""
 
     settings = get_settings()
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse, lifespan=_lifespan)
+    # Multipart bodies carry the message field alongside the carrier file.
+    app.add_middleware(MaxBodySizeMiddleware, max_bytes=settings.max_upload_bytes + settings.max_message_bytes)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.allowed_origins,
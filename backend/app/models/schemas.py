@@ -26,14 +26,10 @@ class DetectionResponse(BaseModel):
     details: dict[str, Any] | None = None
 
 
-class WaveformPoint(BaseModel):
-    position: float = Field(description="Normalized position in the audio clip")
-    amplitude: float = Field(description="Normalized sample magnitude")
-
-
 class AudioSuiteResponse(BaseModel):
     stego: StegoResponse
-    waveform: list[WaveformPoint]
+    waveform_positions: list[float] = Field(description="Normalized positions in the audio clip")
+    waveform_amplitudes: list[float] = Field(description="Normalized sample magnitudes, aligned with positions")
 
 
 class AudioFeature(BaseModel):
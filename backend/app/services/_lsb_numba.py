@@ -0,0 +1,48 @@
+"""Optional Numba kernels for 16-bit PCM LSB coding."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional extra
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if NUMBA_AVAILABLE:
+
+    # Serial kernels: requests already run concurrently on the threadpool, and the
+    # ``workqueue`` threading layer aborts the process on concurrent parallel calls.
+    # ``nogil`` lets those concurrent calls overlap instead.
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def embed_lsb_i16(samples: np.ndarray, data: np.ndarray) -> None:
+        """Write each bit of ``data`` (MSB first) into the LSB of consecutive samples, in place."""
+
+        for i in range(data.size):
+            byte = data[i]
+            base = i * 8
+            for bit in range(8):
+                index = base + bit
+                samples[index] = (samples[index] & ~1) | ((byte >> (7 - bit)) & 1)
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def extract_lsb_i16(samples: np.ndarray, start: int, out: np.ndarray) -> None:
+        """Pack the LSBs of ``samples[start:]`` into ``out``, eight samples per byte."""
+
+        for i in range(out.size):
+            base = start + i * 8
+            acc = 0
+            for bit in range(8):
+                acc = (acc << 1) | (samples[base + bit] & 1)
+            out[i] = acc
+
+    # Compile (or load from cache) at import time so the first request does not pay for it.
+    _warm = np.zeros(64, dtype=np.int16)
+    embed_lsb_i16(_warm, np.zeros(8, dtype=np.uint8))
+    extract_lsb_i16(_warm, 0, np.empty(8, dtype=np.uint8))
+    # Extraction usually runs on read-only views of the upload buffer, which Numba types separately.
+    _warm.setflags(write=False)
+    extract_lsb_i16(_warm, 0, np.empty(8, dtype=np.uint8))
+    del _warm
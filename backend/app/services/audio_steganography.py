@@ -3,35 +3,122 @@
 from __future__ import annotations
 
 from io import BytesIO
+from typing import BinaryIO
+import struct
 import wave
 
 import numpy as np
 
-_HEADER_BYTES = 4
-
+from app.services import _lsb_numba
 
-def _load_samples(audio_bytes: bytes) -> tuple[wave._wave_params, np.ndarray]:
-    buffer = BytesIO(audio_bytes)
-    try:
-        with wave.open(buffer) as wav_file:
-            params = wav_file.getparams()
-            frames = wav_file.readframes(wav_file.getnframes())
-    except wave.Error as exc:  # pragma: no cover - dependent on external files
-        raise ValueError("Unsupported or corrupted WAV stream") from exc
+_HEADER_BYTES = 4
+_WAVE_FORMAT_PCM = 0x0001
+_EMBED_CHUNK_BYTES = 64 * 1024
+
+
+def _parse_wav(buf: bytes) -> tuple[wave._wave_params, int, int] | None:
+    """Locate the PCM ``data`` chunk of a canonical RIFF/WAVE buffer.
+
+    Returns ``(params, data_offset, sample_count)`` or ``None`` when the layout is not plain PCM so the
+    caller can defer to :mod:`wave`.
+    """
+
+    if len(buf) < 12:
+        return None
+    riff, _, form = struct.unpack_from("<4sI4s", buf)
+    if riff != b"RIFF" or form != b"WAVE":
+        return None
+
+    fmt: tuple[int, ...] | None = None
+    offset = 12
+    while offset + 8 <= len(buf):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", buf, offset)
+        body = offset + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            if body + 16 > len(buf):
+                # Truncated fmt body; let :mod:`wave` reject it with its usual error.
+                return None
+            fmt = struct.unpack_from("<HHIIHH", buf, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            audio_format, channels, framerate, _, _, bits = fmt
+            if audio_format != _WAVE_FORMAT_PCM or channels == 0:
+                return None
+            sampwidth = bits // 8
+            data_size = min(chunk_size, len(buf) - body)
+            nframes = data_size // (channels * sampwidth) if sampwidth else 0
+            params = wave._wave_params(channels, sampwidth, framerate, nframes, "NONE", "not compressed")
+            return params, body, nframes * channels
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _load_samples(audio: BinaryIO, *, writable: bool = False) -> tuple[wave._wave_params, np.ndarray]:
+    buf = audio.read()
+    parsed = _parse_wav(buf)
+    if parsed is None:
+        try:
+            with wave.open(BytesIO(buf), "rb") as wav_file:
+                params = wav_file.getparams()
+                frames = wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError) as exc:  # pragma: no cover - dependent on external files
+            raise ValueError("Unsupported or corrupted WAV stream") from exc
+        offset, count = 0, len(frames) // 2
+    else:
+        params, offset, count = parsed
+        frames = buf
 
     if params.sampwidth != 2:
         raise ValueError("Only 16-bit PCM WAV files are supported")
 
-    samples = np.frombuffer(frames, dtype=np.int16).copy()
+    # WAV PCM is little-endian by spec; pin the dtype so the low byte of each sample sits at even offsets.
+    # The view is zero-copy; embedding asks for a private writable copy because it mutates samples in place.
+    samples = np.frombuffer(frames, dtype="<i2", count=count, offset=offset)
+    if writable:
+        samples = samples.copy()
     return params, samples
 
 
+def _lsb_bits(samples: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Return the LSBs of ``samples[start:end]`` as a tight ``uint8`` bit array."""
+
+    return samples[start:end].view(np.uint8)[::2] & np.uint8(1)
+
+
+def _use_kernels(samples: np.ndarray) -> bool:
+    return _lsb_numba.NUMBA_AVAILABLE and samples.dtype.isnative
+
+
+def _pack_lsbs(samples: np.ndarray, start: int, n_bytes: int) -> bytes:
+    if _use_kernels(samples):
+        out = np.empty(n_bytes, dtype=np.uint8)
+        _lsb_numba.extract_lsb_i16(samples, start, out)
+        return out.tobytes()
+    return np.packbits(_lsb_bits(samples, start, start + n_bytes * 8)).tobytes()
+
+
 def _write_wave(params: wave._wave_params, samples: np.ndarray) -> bytes:
-    buffer = BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setparams(params)
-        wav_file.writeframes(samples.astype(np.int16).tobytes())
-    return buffer.getvalue()
+    data = np.ascontiguousarray(samples, dtype="<i2")
+    block_align = params.nchannels * params.sampwidth
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data.nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        _WAVE_FORMAT_PCM,
+        params.nchannels,
+        params.framerate,
+        params.framerate * block_align,
+        block_align,
+        params.sampwidth * 8,
+        b"data",
+        data.nbytes,
+    )
+    # join sizes the output once and copies the sample buffer straight into it.
+    return b"".join((header, memoryview(data).cast("B")))
 
 
 def _embed_samples(samples: np.ndarray, payload: bytes) -> np.ndarray:
@@ -40,30 +127,38 @@ def _embed_samples(samples: np.ndarray, payload: bytes) -> np.ndarray:
         raise ValueError("Message is too large for this audio clip")
 
     header = len(payload).to_bytes(_HEADER_BYTES, "big")
-    data_bits = np.unpackbits(np.frombuffer(header + payload, dtype=np.uint8))
-
-    modified = samples.copy()
-    modified[: total_bits] = (modified[: total_bits] & ~1) | data_bits
-    return modified
-
-
-def embed_message(audio_bytes: bytes, payload: bytes) -> bytes:
+    data = np.frombuffer(header + payload, dtype=np.uint8)
+    if _use_kernels(samples):
+        _lsb_numba.embed_lsb_i16(samples, data)
+        return samples
+
+    # ``samples`` is already a private copy from ``_load_samples``, so mutate the prefix in place.
+    # Unpack in blocks so the bit temporaries stay cache-sized instead of 8x the payload.
+    for offset in range(0, data.size, _EMBED_CHUNK_BYTES):
+        bits = np.unpackbits(data[offset : offset + _EMBED_CHUNK_BYTES])
+        start = offset * 8
+        window = samples[start : start + bits.size]
+        np.bitwise_and(window, np.int16(~1), out=window)
+        np.bitwise_or(window, bits, out=window)
+    return samples
+
+
+def embed_message(audio: BinaryIO, payload: bytes) -> bytes:
     """Embed the payload into the least-significant bits of the signal."""
 
-    params, samples = _load_samples(audio_bytes)
+    params, samples = _load_samples(audio, writable=True)
     modified = _embed_samples(samples, payload)
     return _write_wave(params, modified)
 
 
-def extract_message(audio_bytes: bytes) -> bytes:
+def extract_message(audio: BinaryIO) -> bytes:
     """Extract the payload from the signal."""
 
-    _, samples = _load_samples(audio_bytes)
+    _, samples = _load_samples(audio)
     if samples.size < _HEADER_BYTES * 8:
         raise ValueError("Audio clip too short to contain data")
 
-    header_bits = samples[: _HEADER_BYTES * 8] & 1
-    header_bytes = np.packbits(header_bits).tobytes()
+    header_bytes = _pack_lsbs(samples, 0, _HEADER_BYTES)
     payload_length = int.from_bytes(header_bytes, "big")
 
     expected_bits = payload_length * 8
@@ -75,56 +170,51 @@ def extract_message(audio_bytes: bytes) -> bytes:
     if payload_length == 0:
         return b""
 
-    payload_bits = samples[start:end] & 1
-    payload = np.packbits(payload_bits).tobytes()
-    return payload[:payload_length]
+    return _pack_lsbs(samples, start, payload_length)
 
 
-def _build_waveform(samples: np.ndarray, channels: int, points: int = 512) -> list[dict[str, float]]:
+def _build_waveform(samples: np.ndarray, channels: int, points: int = 512) -> dict[str, list[float]]:
     if samples.size == 0:
-        return []
-
-    if channels > 1:
-        samples = samples.reshape(-1, channels).mean(axis=1)
+        return {"positions": [], "amplitudes": []}
 
-    count = min(points, samples.size)
-    indices = np.linspace(0, samples.size - 1, count, dtype=np.int64)
-    subset = samples[indices]
+    frames = samples.reshape(-1, channels)
+    count = min(points, frames.shape[0])
+    step = max(1, frames.shape[0] // count)
+    # Stride over frames first so only the retained rows are down-mixed.
+    subset = frames[: step * count : step].mean(axis=1)
     max_amplitude = float(np.max(np.abs(subset))) or 1.0
-    normalized = subset / max_amplitude
-    positions = np.linspace(0.0, 1.0, count)
+    normalized = (subset / max_amplitude).astype(np.float32)
+    positions = np.linspace(0.0, 1.0, count, dtype=np.float32)
 
-    return [
-        {"position": float(pos), "amplitude": float(val)}
-        for pos, val in zip(positions, normalized)
-    ]
+    return {"positions": positions.tolist(), "amplitudes": normalized.tolist()}
 
 
-def embed_with_waveform(audio_bytes: bytes, payload: bytes) -> dict[str, object]:
+def embed_with_waveform(audio: BinaryIO, payload: bytes) -> dict[str, object]:
     """Embed data and provide waveform samples for UI rendering."""
 
-    params, samples = _load_samples(audio_bytes)
+    params, samples = _load_samples(audio, writable=True)
     modified = _embed_samples(samples, payload)
     audio_payload = _write_wave(params, modified)
     waveform = _build_waveform(modified, params.nchannels)
     return {"audio": BytesIO(audio_payload), "waveform": waveform}
 
 
-def estimate_steganography_probability(audio_bytes: bytes, *, sample_size: int) -> dict[str, float]:
+def estimate_steganography_probability(audio: BinaryIO, *, sample_size: int) -> dict[str, float]:
     """Return a heuristic confidence score based on LSB noise."""
 
-    params, samples = _load_samples(audio_bytes)
+    params, samples = _load_samples(audio)
     if samples.size == 0:
         raise ValueError("Unable to analyze empty audio clip")
 
     subset = samples
     if sample_size and sample_size < samples.size:
-        indices = np.linspace(0, samples.size - 1, sample_size, dtype=np.int64)
-        subset = samples[indices]
+        step = samples.size // sample_size
+        subset = samples[: step * sample_size : step]
 
-    lsb = (subset & 1).astype(np.uint8)
-    ratio = float(lsb.mean())
-    transitions = float(np.count_nonzero(np.diff(lsb))) / (lsb.size - 1) if lsb.size > 1 else 0.0
+    lsb = np.empty(subset.size, dtype=np.uint8)
+    np.bitwise_and(subset, 1, out=lsb, casting="unsafe")
+    ratio = np.count_nonzero(lsb) / lsb.size
+    transitions = np.count_nonzero(np.not_equal(lsb[:-1], lsb[1:])) / (lsb.size - 1) if lsb.size > 1 else 0.0
     uniformity = max(0.0, 1.0 - abs(ratio - 0.5) * 4)
     probability = max(0.0, min(1.0, uniformity * 0.6 + transitions * 0.4))
 
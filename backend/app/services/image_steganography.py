@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from io import BytesIO
+from typing import BinaryIO
 
 import numpy as np
 from PIL import Image
@@ -10,16 +11,16 @@ from PIL import Image
 _HEADER_BYTES = 4
 
 
-def _load_rgba(image_bytes: bytes) -> tuple[np.ndarray, Image.Image]:
-    image = Image.open(BytesIO(image_bytes)).convert("RGBA")
+def _load_rgba(image_file: BinaryIO) -> tuple[np.ndarray, Image.Image]:
+    image = Image.open(image_file).convert("RGBA")
     pixels = np.array(image, dtype=np.uint8)
     return pixels, image
 
 
-def embed_message(image_bytes: bytes, payload: bytes) -> bytes:
+def embed_message(image_file: BinaryIO, payload: bytes) -> bytes:
     """Embed the payload into the least-significant bits of the RGB channels."""
 
-    pixels, image = _load_rgba(image_bytes)
+    pixels, image = _load_rgba(image_file)
     rgb = pixels[..., :3]
     flat = rgb.reshape(-1)
 
@@ -36,14 +37,14 @@ def embed_message(image_bytes: bytes, payload: bytes) -> bytes:
     pixels[..., :3] = rgb
 
     buffer = BytesIO()
-    Image.fromarray(pixels, mode="RGBA").save(buffer, format="PNG")
+    Image.fromarray(pixels, mode="RGBA").save(buffer, format="PNG", compress_level=1, optimize=False)
     return buffer.getvalue()
 
 
-def extract_message(image_bytes: bytes) -> bytes:
+def extract_message(image_file: BinaryIO) -> bytes:
     """Recover an embedded payload from the image."""
 
-    pixels, _ = _load_rgba(image_bytes)
+    pixels, _ = _load_rgba(image_file)
     flat = pixels[..., :3].reshape(-1)
 
     if flat.size < _HEADER_BYTES * 8:
@@ -67,21 +68,24 @@ def extract_message(image_bytes: bytes) -> bytes:
     return payload[:payload_length]
 
 
-def estimate_steganography_probability(image_bytes: bytes, *, sample_size: int) -> dict[str, float]:
+def estimate_steganography_probability(image_file: BinaryIO, *, sample_size: int) -> dict[str, float]:
     """Return a lightweight confidence score based on LSB distribution heuristics."""
 
-    pixels, _ = _load_rgba(image_bytes)
+    pixels, _ = _load_rgba(image_file)
     flat = pixels[..., :3].reshape(-1)
     if flat.size == 0:
         raise ValueError("Unable to analyze empty image")
 
-    lsb = (flat & 1).astype(np.uint8)
-    if sample_size and sample_size < lsb.size:
-        indices = np.linspace(0, lsb.size - 1, sample_size, dtype=np.int64)
-        lsb = lsb[indices]
+    if sample_size and sample_size < flat.size:
+        step = flat.size // sample_size
+        flat = flat[: step * sample_size : step]
 
-    ratio = float(lsb.mean())
-    variance = float(lsb.var())
+    # ``flat`` is a private copy (or a view of one), so the mask can be applied in place.
+    lsb = np.bitwise_and(flat, 1, out=flat)
+
+    ratio = np.count_nonzero(lsb) / lsb.size
+    # Variance of a 0/1 sample is p(1 - p); no second pass over the data is needed.
+    variance = ratio * (1.0 - ratio)
     uniformity = max(0.0, 1.0 - abs(ratio - 0.5) * 4)
     probability = max(0.0, min(1.0, uniformity * 0.7 + min(variance * 8, 0.3)))
 
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
 import base64
+import hashlib
 import os
+import threading
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
@@ -11,13 +15,38 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 _SALT_SIZE = 16
 _ITERATIONS = 390000
+_KEY_CACHE_SIZE = 128
+
+# Keyed by (sha256(passphrase), salt) so plaintext passphrases are never retained.
+_key_cache: OrderedDict[tuple[bytes, bytes], bytes] = OrderedDict()
+_key_cache_lock = threading.Lock()
 
 
 def _derive_key(passphrase: str, salt: bytes) -> bytes:
-    """Derive a Fernet key from a user passphrase and salt."""
+    """Derive a Fernet key from a user passphrase and salt, reusing recent derivations."""
+
+    secret = passphrase.encode("utf-8")
+    cache_key = (hashlib.sha256(secret).digest(), salt)
+    with _key_cache_lock:
+        key = _key_cache.get(cache_key)
+        if key is not None:
+            _key_cache.move_to_end(cache_key)
+            return key
 
     kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=_ITERATIONS)
-    return base64.urlsafe_b64encode(kdf.derive(passphrase.encode("utf-8")))
+    key = base64.urlsafe_b64encode(kdf.derive(secret))
+    with _key_cache_lock:
+        _key_cache[cache_key] = key
+        if len(_key_cache) > _KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return key
+
+
+@lru_cache(maxsize=256)
+def _fernet(key: bytes) -> Fernet:
+    """Return a reusable Fernet instance for a derived key."""
+
+    return Fernet(key)
 
 
 def encrypt_message(message: bytes, passphrase: str) -> bytes:
@@ -27,7 +56,7 @@ def encrypt_message(message: bytes, passphrase: str) -> bytes:
         return message
     salt = os.urandom(_SALT_SIZE)
     key = _derive_key(passphrase, salt)
-    token = Fernet(key).encrypt(message)
+    token = _fernet(key).encrypt(message)
     return salt + token
 
 
@@ -41,6 +70,6 @@ def decrypt_message(payload: bytes, passphrase: str) -> bytes:
     salt, token = payload[:_SALT_SIZE], payload[_SALT_SIZE:]
     key = _derive_key(passphrase, salt)
     try:
-        return Fernet(key).decrypt(token)
+        return _fernet(key).decrypt(token)
     except InvalidToken as exc:
         raise ValueError("Invalid passphrase or corrupted payload") from exc
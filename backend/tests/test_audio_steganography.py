@@ -0,0 +1,13 @@
+from io import BytesIO
+
+import pytest
+
+from app.services.audio_steganography import extract_message
+
+
+def test_truncated_fmt_chunk_is_rejected() -> None:
+    # The fmt header promises 16 bytes but carries two; this must be a ValueError
+    # (HTTP 400), not a struct.error.
+    truncated = b"RIFF\0\0\0\0WAVEfmt \x10\0\0\0\x01\0"
+    with pytest.raises(ValueError):
+        extract_message(BytesIO(truncated))
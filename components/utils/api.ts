@@ -33,7 +33,8 @@ interface WaveformPointPayload {
 
 interface AudioSuiteResponsePayload {
   stego: StegoResponsePayload;
-  waveform: WaveformPointPayload[];
+  waveform_positions: number[];
+  waveform_amplitudes: number[];
 }
 
 export interface AudioOverviewPayload {
@@ -187,7 +188,10 @@ export async function embedAudioSuite(file: File, message: string, passphrase?:
   const payload = await postMultipart<AudioSuiteResponsePayload>("/steganography/audio/suite/embed", formData);
   return {
     asset: mapStegoAsset(payload.stego),
-    waveform: payload.waveform,
+    waveform: payload.waveform_positions.map((position, index) => ({
+      position,
+      amplitude: payload.waveform_amplitudes[index],
+    })),
   };
 }
 
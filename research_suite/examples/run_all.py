@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from . import audio_example, fs_example, image_example, network_example, text_example, video_example, watermark_example
@@ -9,13 +11,22 @@ from . import audio_example, fs_example, image_example, network_example, text_ex
 
 def main() -> None:
     base = Path("artifacts/examples")
-    audio_example.run(base / "audio")
-    fs_example.run(base / "fs")
-    image_example.run(base / "image")
-    network_example.run(base / "network")
-    text_example.run(base / "text")
-    video_example.run(base / "video")
-    watermark_example.run(base / "watermark")
+    tasks = [
+        (audio_example.run, base / "audio"),
+        (fs_example.run, base / "fs"),
+        (image_example.run, base / "image"),
+        (network_example.run, base / "network"),
+        (text_example.run, base / "text"),
+        (video_example.run, base / "video"),
+        (watermark_example.run, base / "watermark"),
+    ]
+    # The examples share no state, so run them in separate processes and surface
+    # the first failure.
+    workers = min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run, path) for run, path in tasks]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
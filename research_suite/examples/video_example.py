@@ -21,8 +21,8 @@ def _generate_video(path: Path) -> None:
     rng = np.random.default_rng(2024)
     fourcc = cv2.VideoWriter_fourcc(*"mp4v")
     writer = cv2.VideoWriter(str(path), fourcc, 24, (128, 128))
-    for frame_idx in range(60):
-        frame = rng.integers(0, 255, size=(128, 128, 3), dtype=np.uint8)
+    frames = rng.integers(0, 255, size=(60, 128, 128, 3), dtype=np.uint8)
+    for frame in frames:
         writer.write(frame)
     writer.release()
 
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
+import os
+import shutil
 import uuid
 from pathlib import Path
 from typing import Any, Dict
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -29,7 +44,6 @@ app = FastAPI(title="StegResearch API", version="0.1.0")
 
 
 def _configure_cors(application: FastAPI) -> None:
-    settings = get_settings()
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -108,14 +122,107 @@ async def health(settings: Settings = Depends(get_settings)) -> Dict[str, Any]:
     }
 
 
-def _write_temp_file(upload: UploadFile, settings: Settings) -> Path:
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _temp_upload_path(filename: str | None, settings: Settings) -> Path:
     temp_dir = (settings.artifact_dir / "uploads").resolve()
     temp_dir.mkdir(parents=True, exist_ok=True)
-    temp_path = (temp_dir / f"{uuid.uuid4()}_{upload.filename}").resolve()
-    temp_path.write_bytes(upload.file.read())
+    return (temp_dir / f"{uuid.uuid4()}_{filename}").resolve()
+
+
+def _sendfile(source: Any, handle: Any) -> bool:
+    """Copy ``source`` into ``handle`` kernel-side.
+
+    Returns ``False`` when ``source`` has no usable descriptor.
+    """
+
+    # A SpooledTemporaryFile still in memory has no name; calling fileno() on it would
+    # force it to disk first, so copy it in user space instead.
+    if getattr(source, "name", None) is None:
+        return False
+    try:
+        src_fd = source.fileno()
+        remaining = os.fstat(src_fd).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(handle.fileno(), src_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    except (AttributeError, OSError):
+        handle.seek(0)
+        handle.truncate()
+        return False
+    return True
+
+
+def _copy_upload(source: Any, temp_path: Path) -> None:
+    source.seek(0)
+    with temp_path.open("wb") as handle:
+        if not _sendfile(source, handle):
+            source.seek(0)
+            shutil.copyfileobj(source, handle, _UPLOAD_CHUNK_SIZE)
+
+
+async def _write_temp_file(upload: UploadFile, settings: Settings) -> Path:
+    temp_path = _temp_upload_path(upload.filename, settings)
+    await run_in_threadpool(_copy_upload, upload.file, temp_path)
     return temp_path
 
 
+async def _receive_body(request: Request, temp_path: Path, limit: int) -> None:
+    """Stream the request body to ``temp_path``, answering 413 past ``limit`` bytes."""
+
+    too_large = HTTPException(status_code=413, detail="Request body too large")
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise too_large
+    received = 0
+    handle = await run_in_threadpool(temp_path.open, "wb")
+    try:
+        async for chunk in request.stream():
+            # Chunked bodies carry no Content-Length, so count what actually arrives.
+            received += len(chunk)
+            if received > limit:
+                raise too_large
+            await run_in_threadpool(handle.write, chunk)
+    except BaseException:
+        handle.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+    handle.close()
+
+
+def _run_embed(
+    carrier: str,
+    method: str,
+    cover_path: Path,
+    cover_name: str | None,
+    payload_bytes: bytes,
+    opts: Dict[str, Any],
+    settings: Settings,
+) -> JSONResponse:
+    output_path = (settings.artifact_dir / "stego").resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+    stego_path = (output_path / f"{uuid.uuid4()}_{cover_name}").resolve()
+
+    embedder = registry.embedder_for(carrier, method)
+    if embedder is None:
+        raise HTTPException(status_code=404, detail="No embedder found")
+    try:
+        metrics = embedder.embed(
+            method, str(cover_path), payload_bytes, str(stego_path), **opts
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=500, detail=f"Embedding failed: {exc}") from exc
+    log_operation("api_embed", carrier=carrier, method=method, output=str(stego_path))
+    return JSONResponse({"metrics": metrics, "stego_path": str(stego_path)})
+
+
 @app.post("/embed")
 async def embed(
     carrier: str = Form(...),
@@ -128,23 +235,92 @@ async def embed(
     if not settings.allow_external_networks and carrier == "network":
         raise HTTPException(status_code=403, detail="Network operations require explicit opt-in")
     opts = json.loads(options)
-    cover_path = _write_temp_file(cover, settings)
-    payload_bytes = payload.file.read()
-    output_path = (settings.artifact_dir / "stego").resolve()
-    output_path.mkdir(parents=True, exist_ok=True)
-    stego_path = (output_path / f"{uuid.uuid4()}_{cover.filename}").resolve()
+    cover_path = await _write_temp_file(cover, settings)
+    payload_bytes = await payload.read()
+    return await run_in_threadpool(
+        _run_embed,
+        carrier,
+        method,
+        cover_path,
+        cover.filename,
+        payload_bytes,
+        opts,
+        settings,
+    )
+
+
+@app.post("/embed/stream")
+async def embed_stream(
+    request: Request,
+    carrier: str = Query(...),
+    method: str = Query(...),
+    filename: str = Query(...),
+    options: str = Query("{}"),
+    payload: str = Header(
+        ..., alias="X-Stego-Payload", description="Base64-encoded payload"
+    ),
+    settings: Settings = Depends(get_settings),
+) -> JSONResponse:
+    """Embed into a cover sent as the raw request body, skipping multipart parsing.
+
+    The payload travels in a header, so the server's header size limit bounds it; send
+    larger payloads through ``/embed``.
+    """
+
+    if not settings.allow_external_networks and carrier == "network":
+        raise HTTPException(
+            status_code=403, detail="Network operations require explicit opt-in"
+        )
+    opts = json.loads(options)
+    try:
+        payload_bytes = base64.b64decode(payload, validate=True)
+    except binascii.Error as exc:
+        raise HTTPException(
+            status_code=400, detail="Payload header is not valid base64"
+        ) from exc
+    cover_name = Path(filename).name
+    cover_path = _temp_upload_path(cover_name, settings)
+    await _receive_body(request, cover_path, settings.max_upload_bytes)
+    return await run_in_threadpool(
+        _run_embed,
+        carrier,
+        method,
+        cover_path,
+        cover_name,
+        payload_bytes,
+        opts,
+        settings,
+    )
+
 
-    for embedder in registry.embedders(carrier):
-        if method in embedder.supported_methods():
-            try:
-                metrics = embedder.embed(method, str(cover_path), payload_bytes, str(stego_path), **opts)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-            except Exception as exc:  # noqa: BLE001
-                raise HTTPException(status_code=500, detail=f"Embedding failed: {exc}") from exc
-            log_operation("api_embed", carrier=carrier, method=method, output=str(stego_path))
-            return JSONResponse({"metrics": metrics, "stego_path": str(stego_path)})
-    raise HTTPException(status_code=404, detail="No embedder found")
+def _run_extract(
+    carrier: str,
+    method: str,
+    stego_path: Path,
+    stego_name: str | None,
+    opts: Dict[str, Any],
+    settings: Settings,
+) -> JSONResponse:
+    extractor = registry.extractor_for(carrier, method)
+    if extractor is None:
+        raise HTTPException(status_code=404, detail="No extractor found")
+    try:
+        result = extractor.extract(method, str(stego_path), **opts)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(
+            status_code=500, detail=f"Extraction failed: {exc}"
+        ) from exc
+    payload = result.pop("payload", b"")
+    payload_path = (settings.artifact_dir / "payloads").resolve()
+    payload_path.mkdir(parents=True, exist_ok=True)
+    output_path = (payload_path / f"{uuid.uuid4()}_{stego_name}.bin").resolve()
+    output_path.write_bytes(payload)
+    log_operation(
+        "api_extract", carrier=carrier, method=method, output=str(output_path)
+    )
+    return JSONResponse({"result": result, "payload_path": str(output_path)})
 
 
 @app.post("/extract")
@@ -158,31 +334,27 @@ async def extract(
     if not settings.allow_external_networks and carrier == "network":
         raise HTTPException(status_code=403, detail="Network operations require explicit opt-in")
     opts = json.loads(options)
-    stego_path = _write_temp_file(stego, settings)
-    for extractor in registry.extractors(carrier):
-        supported_methods = []
-        supported_fn = getattr(extractor, "supported_methods", None)
-        if callable(supported_fn):
-            try:
-                supported_methods = list(supported_fn())
-            except TypeError:
-                supported_methods = []
-        name_matches = method == extractor.name or method.startswith(f"{extractor.name}-")
-        if name_matches or method in supported_methods:
-            try:
-                result = extractor.extract(method, str(stego_path), **opts)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-            except Exception as exc:  # noqa: BLE001
-                raise HTTPException(status_code=500, detail=f"Extraction failed: {exc}") from exc
-            payload = result.pop("payload", b"")
-            payload_path = (settings.artifact_dir / "payloads").resolve()
-            payload_path.mkdir(parents=True, exist_ok=True)
-            output_path = (payload_path / f"{uuid.uuid4()}_{stego.filename}.bin").resolve()
-            output_path.write_bytes(payload)
-            log_operation("api_extract", carrier=carrier, method=method, output=str(output_path))
-            return JSONResponse({"result": result, "payload_path": str(output_path)})
-    raise HTTPException(status_code=404, detail="No extractor found")
+    stego_path = await _write_temp_file(stego, settings)
+    return await run_in_threadpool(
+        _run_extract,
+        carrier,
+        method,
+        stego_path,
+        stego.filename,
+        opts,
+        settings,
+    )
+
+
+def _run_detect(carrier: str, stego_path: Path, opts: Dict[str, Any]) -> JSONResponse:
+    detections = []
+    for detector in registry.detectors(carrier):
+        try:
+            detections.append({"detector": detector.name, **detector.detect(str(stego_path), **opts)})
+        except Exception as exc:  # noqa: BLE001
+            detections.append({"detector": detector.name, "error": str(exc)})
+    log_operation("api_detect", carrier=carrier, detections=len(detections))
+    return JSONResponse({"detections": detections})
 
 
 @app.post("/detect")
@@ -195,15 +367,8 @@ async def detect(
     if not settings.allow_external_networks and carrier == "network":
         raise HTTPException(status_code=403, detail="Network operations require explicit opt-in")
     opts = json.loads(options)
-    stego_path = _write_temp_file(stego, settings)
-    detections = []
-    for detector in registry.detectors(carrier):
-        try:
-            detections.append({"detector": detector.name, **detector.detect(str(stego_path), **opts)})
-        except Exception as exc:  # noqa: BLE001
-            detections.append({"detector": detector.name, "error": str(exc)})
-    log_operation("api_detect", carrier=carrier, detections=len(detections))
-    return JSONResponse({"detections": detections})
+    stego_path = await _write_temp_file(stego, settings)
+    return await run_in_threadpool(_run_detect, carrier, stego_path, opts)
 
 
 @app.get("/metrics")
@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
 import numpy as np
 import soundfile as sf
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 from ...core.metrics import snr
+from .pcm import open_pcm
+
+
+def _frames(samples: np.ndarray, frame_size: int) -> np.ndarray:
+    count = len(samples) // frame_size
+    return samples[: count * frame_size].reshape(count, frame_size)
+
+
+def _lag_correlation(frames: np.ndarray, delay: int) -> np.ndarray:
+    """Autocorrelation of every frame at a single lag, as one fused multiply-reduce."""
+
+    if not 0 <= delay < frames.shape[1]:
+        return np.zeros(frames.shape[0], dtype=np.float64)
+    head = frames[:, delay:]
+    tail = frames[:, : frames.shape[1] - delay]
+    return np.einsum("ij,ij->i", head, tail, dtype=np.float64)
 
 
-@dataclass
 class AudioEchoEmbedder(Embedder):
-    name: str = "echo"
-    carrier: str = "audio"
+    name = "echo"
+    carrier = "audio"
 
     def supported_methods(self) -> Iterable[str]:
         return ["echo-binary"]
@@ -26,30 +41,29 @@ class AudioEchoEmbedder(Embedder):
         if method != "echo-binary":
             raise ValueError("Unsupported method")
 
-        samples, samplerate = sf.read(carrier_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        samples = samples.astype(np.float32)
+        pcm, samplerate = open_pcm(carrier_path)
+        samples = pcm.astype(np.float32) / 32768.0
         delay_short = int(options.get("delay_short", 0.002 * samplerate))
         delay_long = int(options.get("delay_long", 0.004 * samplerate))
         decay = float(options.get("decay", 0.5))
 
-        bits = [int(bit) for byte in payload for bit in f"{byte:08b}"]
+        bits = bytes_to_bits(payload)
         frame_size = int(options.get("frame_size", samplerate // 10))
         frames = len(samples) // frame_size
         if len(bits) > frames:
             raise ValueError("Payload too large for echo coding")
 
+        # Each coded frame gets an echo of itself; the echo never crosses into the
+        # next frame.
+        span = len(bits) * frame_size
         stego = samples.copy()
-        for idx, bit in enumerate(bits):
-            start = idx * frame_size
-            end = start + frame_size
-            frame = stego[start:end]
-            delay = delay_long if bit else delay_short
-            echo = np.zeros_like(frame)
-            if delay < len(frame):
-                echo[delay:] = frame[:-delay]
-            stego[start:end] += decay * echo
+        cover_rows = samples[:span].reshape(len(bits), frame_size)
+        stego_rows = stego[:span].reshape(len(bits), frame_size)
+        for delay, bit in ((delay_short, 0), (delay_long, 1)):
+            if not 0 < delay < frame_size:
+                continue
+            rows = np.flatnonzero(bits == bit)
+            stego_rows[rows, delay:] += decay * cover_rows[rows, : frame_size - delay]
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         sf.write(output_path, stego, samplerate)
@@ -63,10 +77,9 @@ class AudioEchoEmbedder(Embedder):
         return metrics
 
 
-@dataclass
 class AudioEchoExtractor(Extractor):
-    name: str = "echo"
-    carrier: str = "audio"
+    name = "echo"
+    carrier = "audio"
 
     def supported_methods(self) -> Iterable[str]:
         return ["echo-binary"]
@@ -75,32 +88,17 @@ class AudioEchoExtractor(Extractor):
         if method != "echo-binary":
             raise ValueError("Unsupported method")
 
-        samples, samplerate = sf.read(stego_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        samples = samples.astype(np.float32)
+        pcm, samplerate = open_pcm(stego_path)
+        samples = pcm.astype(np.float32) / 32768.0
         delay_short = int(options.get("delay_short", 0.002 * samplerate))
         delay_long = int(options.get("delay_long", 0.004 * samplerate))
         frame_size = int(options.get("frame_size", samplerate // 10))
 
-        frames = len(samples) // frame_size
-        recovered_bits = []
-        for idx in range(frames):
-            frame = samples[idx * frame_size : (idx + 1) * frame_size]
-            autocorr = np.correlate(frame, frame, mode="full")
-            autocorr = autocorr[len(autocorr) // 2 :]
-            short_val = autocorr[delay_short] if delay_short < len(autocorr) else 0
-            long_val = autocorr[delay_long] if delay_long < len(autocorr) else 0
-            recovered_bits.append(1 if long_val > short_val else 0)
-
-        bytes_out = []
-        for index in range(0, len(recovered_bits), 8):
-            chunk = recovered_bits[index : index + 8]
-            if len(chunk) < 8:
-                break
-            value = int("".join(map(str, chunk)), 2)
-            bytes_out.append(value)
-        payload = bytes(bytes_out)
+        frames = _frames(samples, frame_size)
+        long_lag = _lag_correlation(frames, delay_long)
+        short_lag = _lag_correlation(frames, delay_short)
+        recovered_bits = (long_lag > short_lag).astype(np.uint8)
+        payload = bits_to_bytes(recovered_bits)
 
         result = {
             "payload": payload,
@@ -110,28 +108,19 @@ class AudioEchoExtractor(Extractor):
         return result
 
 
-@dataclass
 class AudioEchoDetector(Detector):
-    name: str = "echo"
-    carrier: str = "audio"
+    name = "echo"
+    carrier = "audio"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        samples, samplerate = sf.read(stego_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        samples = samples.astype(np.float32)
+        pcm, samplerate = open_pcm(stego_path)
+        samples = pcm.astype(np.float32) / 32768.0
         frame_size = int(options.get("frame_size", samplerate // 10))
         delay_long = int(options.get("delay_long", 0.004 * samplerate))
 
-        frames = len(samples) // frame_size
-        scores = []
-        for idx in range(frames):
-            frame = samples[idx * frame_size : (idx + 1) * frame_size]
-            autocorr = np.correlate(frame, frame, mode="full")
-            autocorr = autocorr[len(autocorr) // 2 :]
-            val = autocorr[delay_long] if delay_long < len(autocorr) else 0.0
-            energy = np.sum(frame**2) + 1e-9
-            scores.append(val / energy)
+        frames = _frames(samples, frame_size)
+        energy = _lag_correlation(frames, 0) + 1e-9
+        scores = _lag_correlation(frames, delay_long) / energy
         probability = float(min(1.0, np.mean(scores) * 10))
         result = {
             "mean_score": float(np.mean(scores)),
@@ -2,33 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable
 
 import numpy as np
 import soundfile as sf
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 from ...core.metrics import snr
+from .pcm import open_pcm
 
-_HEADER_LENGTH = 32
+_HEADER_LENGTH = 4
 
 
-def _bytes_to_bits(payload: bytes) -> List[int]:
-    return [int(bit) for byte in payload for bit in f"{byte:08b}"]
-
-
-def _bits_to_bytes(bits: Iterable[int]) -> bytes:
-    bit_str = "".join(str(bit) for bit in bits)
-    return int(bit_str, 2).to_bytes(len(bit_str) // 8, byteorder="big")
-
-
-@dataclass
 class AudioLSBEmbedder(Embedder):
-    name: str = "lsb"
-    carrier: str = "audio"
+    name = "lsb"
+    carrier = "audio"
 
     def supported_methods(self) -> Iterable[str]:
         return ["pcm-lsb"]
@@ -44,21 +35,19 @@ class AudioLSBEmbedder(Embedder):
         if method != "pcm-lsb":
             raise ValueError("Unsupported method")
 
-        samples, samplerate = sf.read(carrier_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        scaled = np.int16(samples * 32767)
+        scaled, samplerate = open_pcm(carrier_path)
 
-        payload_bits = _bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
-        if len(payload_bits) > len(scaled):
+        header = len(payload).to_bytes(_HEADER_LENGTH, "big")
+        payload_bits = bytes_to_bits(header + payload)
+        n = payload_bits.size
+        if n > scaled.size:
             raise ValueError("Payload too large")
 
-        for index, bit in enumerate(payload_bits):
-            scaled[index] = (scaled[index] & ~1) | bit
-
-        stego = scaled.astype(np.int16)
+        stego = scaled.copy()
+        stego[:n] &= ~np.int16(1)
+        stego[:n] |= payload_bits.astype(np.int16)
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        sf.write(output_path, stego / 32767.0, samplerate)
+        sf.write(output_path, stego, samplerate, subtype="PCM_16")
 
         metrics = {
             "capacity_bits": len(payload_bits),
@@ -69,10 +58,9 @@ class AudioLSBEmbedder(Embedder):
         return metrics
 
 
-@dataclass
 class AudioLSBExtractor(Extractor):
-    name: str = "lsb"
-    carrier: str = "audio"
+    name = "lsb"
+    carrier = "audio"
 
     def supported_methods(self) -> Iterable[str]:
         return ["pcm-lsb"]
@@ -81,15 +69,12 @@ class AudioLSBExtractor(Extractor):
         if method != "pcm-lsb":
             raise ValueError("Unsupported method")
 
-        samples, _ = sf.read(stego_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        scaled = np.int16(samples * 32767)
+        scaled, _ = open_pcm(stego_path)
 
         length_bits = scaled[:_HEADER_LENGTH * 8] & 1
-        payload_length = int("".join(map(str, length_bits)), 2)
+        payload_length = int.from_bytes(bits_to_bytes(length_bits), "big")
         payload_bits = scaled[_HEADER_LENGTH * 8 : (_HEADER_LENGTH + payload_length) * 8] & 1
-        payload = _bits_to_bytes(payload_bits)
+        payload = bits_to_bytes(payload_bits)
 
         result = {
             "payload_length": payload_length,
@@ -99,18 +84,14 @@ class AudioLSBExtractor(Extractor):
         return result
 
 
-@dataclass
 class AudioLSBDetector(Detector):
-    name: str = "lsb"
-    carrier: str = "audio"
+    name = "lsb"
+    carrier = "audio"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        samples, _ = sf.read(stego_path)
-        if samples.ndim > 1:
-            samples = samples[:, 0]
-        scaled = np.int16(samples * 32767)
-        lsb = scaled & 1
-        bias = abs(np.mean(lsb) - 0.5)
+        samples, _ = open_pcm(stego_path)
+        lsb_sum = np.bitwise_and(samples, 1).sum(dtype=np.int64)
+        bias = abs(lsb_sum / samples.size - 0.5)
         probability = float(1 - min(1.0, bias * 4))
 
         result = {
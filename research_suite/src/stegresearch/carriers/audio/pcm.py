@@ -0,0 +1,51 @@
+"""Decode-free access to 16-bit PCM audio."""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+
+def _data_chunk(raw: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Return ``(offset, size)`` of the RIFF ``data`` chunk, or ``None`` if missing."""
+
+    length = os.fstat(raw.fileno()).st_size
+    header = raw.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+    offset = 12
+    while offset + 8 <= length:
+        raw.seek(offset)
+        chunk_id, size = struct.unpack("<4sI", raw.read(8))
+        if chunk_id == b"data":
+            return offset + 8, min(size, length - offset - 8)
+        offset += 8 + size + (size & 1)
+    return None
+
+
+def open_pcm(path: str | Path) -> Tuple[np.ndarray, int]:
+    """Return the first channel of an audio file as ``int16`` samples and its rate.
+
+    The ``data`` chunk of a 16-bit PCM WAV file is read straight into an ``int16`` array
+    without decoding; other formats fall back to a soundfile decode to ``int16``. The
+    samples are a private copy, so callers may overwrite ``path`` while holding them.
+    """
+
+    info = sf.info(str(path))
+    if info.format == "WAV" and info.subtype == "PCM_16":
+        with open(path, "rb") as raw:
+            chunk = _data_chunk(raw)
+            if chunk is not None:
+                offset, size = chunk
+                frames = size // (2 * info.channels)
+                raw.seek(offset)
+                pcm = np.fromfile(raw, dtype="<i2", count=frames * info.channels)
+                return pcm.reshape(frames, info.channels)[:, 0], info.samplerate
+
+    samples, samplerate = sf.read(str(path), dtype="int16", always_2d=True)
+    return samples[:, 0], samplerate
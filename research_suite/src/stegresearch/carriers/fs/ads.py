@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import shutil
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
@@ -12,10 +12,9 @@ from ...core.logging import log_operation
 _SUFFIX = ".hidden"
 
 
-@dataclass
 class AlternateStreamEmbedder(Embedder):
-    name: str = "ads"
-    carrier: str = "fs"
+    name = "ads"
+    carrier = "fs"
 
     def supported_methods(self) -> Iterable[str]:
         return ["sidecar"]
@@ -26,7 +25,7 @@ class AlternateStreamEmbedder(Embedder):
 
         carrier = Path(carrier_path)
         output = Path(output_path)
-        output.write_bytes(carrier.read_bytes())
+        shutil.copyfile(carrier, output)
         hidden_path = output.with_name(output.name + _SUFFIX)
         hidden_path.write_bytes(payload)
         metrics = {
@@ -37,10 +36,9 @@ class AlternateStreamEmbedder(Embedder):
         return metrics
 
 
-@dataclass
 class AlternateStreamExtractor(Extractor):
-    name: str = "ads"
-    carrier: str = "fs"
+    name = "ads"
+    carrier = "fs"
 
     def supported_methods(self) -> Iterable[str]:
         return ["sidecar"]
@@ -48,7 +46,7 @@ class AlternateStreamExtractor(Extractor):
     def extract(self, method: str, stego_path: str, **options: Any) -> Dict[str, Any]:
         if method != "sidecar":
             raise ValueError("Unsupported method")
-        hidden_path = Path(stego_path).with_name(Path(stego_path).name + _SUFFIX)
+        hidden_path = Path(str(stego_path) + _SUFFIX)
         payload = hidden_path.read_bytes() if hidden_path.exists() else b""
         result = {
             "payload": payload,
@@ -58,13 +56,12 @@ class AlternateStreamExtractor(Extractor):
         return result
 
 
-@dataclass
 class AlternateStreamDetector(Detector):
-    name: str = "ads"
-    carrier: str = "fs"
+    name = "ads"
+    carrier = "fs"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        hidden_path = Path(stego_path).with_name(Path(stego_path).name + _SUFFIX)
+        hidden_path = Path(str(stego_path) + _SUFFIX)
         exists = hidden_path.exists()
         size = hidden_path.stat().st_size if exists else 0
         result = {
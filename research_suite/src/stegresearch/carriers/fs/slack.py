@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import shutil
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
@@ -12,10 +12,9 @@ from ...core.logging import log_operation
 _SUFFIX = ".slack"
 
 
-@dataclass
 class SlackSpaceEmbedder(Embedder):
-    name: str = "slack"
-    carrier: str = "fs"
+    name = "slack"
+    carrier = "fs"
 
     def supported_methods(self) -> Iterable[str]:
         return ["pseudo-slack"]
@@ -25,7 +24,9 @@ class SlackSpaceEmbedder(Embedder):
             raise ValueError("Unsupported method")
         carrier = Path(carrier_path)
         output = Path(output_path)
-        output.write_bytes(carrier.read_bytes())
+        # copyfile lets the kernel move the bytes (sendfile on Linux) instead of
+        # buffering the carrier.
+        shutil.copyfile(carrier, output)
         slack_path = output.with_name(output.name + _SUFFIX)
         slack_path.write_bytes(payload)
         metrics = {
@@ -36,10 +37,9 @@ class SlackSpaceEmbedder(Embedder):
         return metrics
 
 
-@dataclass
 class SlackSpaceExtractor(Extractor):
-    name: str = "slack"
-    carrier: str = "fs"
+    name = "slack"
+    carrier = "fs"
 
     def supported_methods(self) -> Iterable[str]:
         return ["pseudo-slack"]
@@ -47,7 +47,7 @@ class SlackSpaceExtractor(Extractor):
     def extract(self, method: str, stego_path: str, **options: Any) -> Dict[str, Any]:
         if method != "pseudo-slack":
             raise ValueError("Unsupported method")
-        slack_path = Path(stego_path).with_name(Path(stego_path).name + _SUFFIX)
+        slack_path = Path(str(stego_path) + _SUFFIX)
         payload = slack_path.read_bytes() if slack_path.exists() else b""
         result = {
             "payload": payload,
@@ -57,13 +57,12 @@ class SlackSpaceExtractor(Extractor):
         return result
 
 
-@dataclass
 class SlackSpaceDetector(Detector):
-    name: str = "slack"
-    carrier: str = "fs"
+    name = "slack"
+    carrier = "fs"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        slack_path = Path(stego_path).with_name(Path(stego_path).name + _SUFFIX)
+        slack_path = Path(str(stego_path) + _SUFFIX)
         exists = slack_path.exists()
         size = slack_path.stat().st_size if exists else 0
         result = {
@@ -4,16 +4,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Tuple
 
 import cv2
 import numpy as np
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 from ...core.metrics import image_arrays, psnr, ssim
 
 _BLOCK = 8
+_HEADER_BITS = 32
+# Mid-band coefficients carrying one bit each, in embedding order.
+_COORDS = np.array([(2, 1), (1, 2), (2, 2), (3, 1), (1, 3)])
+# Orthonormal DCT-II basis: the 2-D block DCT is ``A @ X @ A.T`` and its inverse
+# ``A.T @ Y @ A``.
+_DCT = np.ascontiguousarray(
+    cv2.dct(np.eye(_BLOCK, dtype=np.float32), flags=cv2.DCT_ROWS).T
+)
+# Every coefficient the carrier reads or writes sits in rows/cols 1..3, so only that
+# 3x3 band is ever transformed.
+_BAND = np.ascontiguousarray(_DCT[1:4])
+_BAND_I = _COORDS[:, 0] - 1
+_BAND_J = _COORDS[:, 1] - 1
 
 
 def _iter_blocks(img: np.ndarray) -> Iterable[Tuple[slice, slice]]:
@@ -23,6 +37,90 @@ def _iter_blocks(img: np.ndarray) -> Iterable[Tuple[slice, slice]]:
             yield slice(y, y + _BLOCK), slice(x, x + _BLOCK)
 
 
+def _is_ragged(channel: np.ndarray) -> bool:
+    return channel.shape[0] % _BLOCK != 0 or channel.shape[1] % _BLOCK != 0
+
+
+def _ragged_embed(channel: np.ndarray, bits: np.ndarray) -> None:
+    """Embed ``bits`` block by block, partial edge blocks included, in place.
+
+    Images whose sides are not multiples of 8 keep the original traversal so their
+    capacity and block order, and therefore existing stego files, stay unchanged.
+    """
+
+    idx = 0
+    for y_slice, x_slice in _iter_blocks(channel):
+        dct_block = cv2.dct(channel[y_slice, x_slice])
+        for i, j in _COORDS:
+            if idx >= bits.size:
+                break
+            dct_block[i, j] = np.round(dct_block[i, j] / 2) * 2 + bits[idx]
+            idx += 1
+        channel[y_slice, x_slice] = cv2.idct(dct_block)
+        if idx >= bits.size:
+            break
+    if idx < bits.size:
+        raise ValueError("Payload too large for cover")
+
+
+def _ragged_bits(channel: np.ndarray, count: int) -> np.ndarray:
+    """Read ``count`` parity bits with the traversal of :func:`_ragged_embed`."""
+
+    bits = []
+    for y_slice, x_slice in _iter_blocks(channel):
+        dct_block = cv2.dct(channel[y_slice, x_slice])
+        for i, j in _COORDS:
+            if len(bits) >= count:
+                break
+            bits.append(int(abs(dct_block[i, j]) % 2))
+        if len(bits) >= count:
+            break
+    return np.array(bits, dtype=np.uint8)
+
+
+def _tile(channel: np.ndarray) -> np.ndarray:
+    """Copy the full 8x8 blocks of ``channel`` into a ``(n_blocks, 8, 8)`` stack.
+
+    Blocks are stacked in row-major block order.
+    """
+
+    bh, bw = channel.shape[0] // _BLOCK, channel.shape[1] // _BLOCK
+    cropped = channel[: bh * _BLOCK, : bw * _BLOCK]
+    blocks = cropped.reshape(bh, _BLOCK, bw, _BLOCK).swapaxes(1, 2)
+    return blocks.reshape(-1, _BLOCK, _BLOCK)
+
+
+def _untile(tiles: np.ndarray, channel: np.ndarray) -> None:
+    """Write a stack produced by :func:`_tile` back into ``channel`` in place."""
+
+    bh, bw = channel.shape[0] // _BLOCK, channel.shape[1] // _BLOCK
+    blocks = tiles.reshape(bh, bw, _BLOCK, _BLOCK).swapaxes(1, 2)
+    blocks = blocks.reshape(bh * _BLOCK, bw * _BLOCK)
+    channel[: bh * _BLOCK, : bw * _BLOCK] = blocks
+
+
+def _forward_band(tiles: np.ndarray) -> np.ndarray:
+    """Return the 3x3 mid-band DCT coefficients of every block in ``tiles``."""
+
+    # einsum folds the block axis into two large GEMMs, so a threaded BLAS spreads
+    # the work across cores instead of looping over tiny 8x8 products on one thread.
+    return np.einsum("ij,bjk,lk->bil", _BAND, tiles, _BAND, optimize=True)
+
+
+def _inverse_band(band: np.ndarray) -> np.ndarray:
+    """Map a ``(n_blocks, 3, 3)`` mid-band stack back to ``(n_blocks, 8, 8)`` pixels."""
+
+    return np.einsum("ji,bjk,kl->bil", _BAND, band, _BAND, optimize=True)
+
+
+def _midband_bits(tiles: np.ndarray, count: int) -> np.ndarray:
+    """Read the first ``count`` coefficient parity bits from the leading ``tiles``."""
+
+    n_blocks = min(len(tiles), -(-count // len(_COORDS)))
+    coeffs = _forward_band(tiles[:n_blocks])[:, _BAND_I, _BAND_J]
+    return (np.abs(coeffs.reshape(-1)[:count]) % 2).astype(np.uint8)
+
+
 @dataclass
 class ImageDCTEmbedder(Embedder):
     name: str = "dct"
@@ -48,30 +146,27 @@ class ImageDCTEmbedder(Embedder):
         image_ycrcb = cv2.cvtColor(image, cv2.COLOR_BGR2YCrCb)
         y_channel = image_ycrcb[:, :, 0].astype(np.float32)
 
-        payload_bits: List[int] = [int(bit) for byte in payload for bit in f"{byte:08b}"]
-        length_bits = [int(bit) for bit in f"{len(payload):032b}"]
-        bits = length_bits + payload_bits
-
-        idx = 0
-        for y_slice, x_slice in _iter_blocks(y_channel):
-            block = y_channel[y_slice, x_slice]
-            dct_block = cv2.dct(block)
-            coords = [(2, 1), (1, 2), (2, 2), (3, 1), (1, 3)]
-            for (i, j) in coords:
-                if idx >= len(bits):
-                    break
-                coeff = dct_block[i, j]
-                coeff = np.round(coeff / 2) * 2
-                if bits[idx] == 1:
-                    coeff += 1
-                dct_block[i, j] = coeff
-                idx += 1
-            y_channel[y_slice, x_slice] = cv2.idct(dct_block)
-            if idx >= len(bits):
-                break
+        bits = bytes_to_bits(len(payload).to_bytes(_HEADER_BITS // 8, "big") + payload)
+        if _is_ragged(y_channel):
+            _ragged_embed(y_channel, bits)
+        else:
+            tiles = _tile(y_channel)
+            n_blocks = -(-bits.size // len(_COORDS))
+            if n_blocks > len(tiles):
+                raise ValueError("Payload too large for cover")
 
-        if idx < len(bits):
-            raise ValueError("Payload too large for cover")
+            # Work on a dense (n_blocks, 5) copy of the mid-band, then map the
+            # coefficient change back to pixels. Blocks past n_blocks are never
+            # transformed and keep their exact values.
+            band = _forward_band(tiles[:n_blocks])
+            midband = band[:, _BAND_I, _BAND_J].reshape(-1)
+            delta = np.zeros_like(midband)
+            head = midband[: bits.size]
+            delta[: bits.size] = np.round(head / 2) * 2 + bits - head
+            band_delta = np.zeros_like(band)
+            band_delta[:, _BAND_I, _BAND_J] = delta.reshape(n_blocks, len(_COORDS))
+            tiles[:n_blocks] += _inverse_band(band_delta)
+            _untile(tiles, y_channel)
 
         image_ycrcb[:, :, 0] = np.clip(y_channel, 0, 255)
         stego_bgr = cv2.cvtColor(image_ycrcb.astype(np.uint8), cv2.COLOR_YCrCb2BGR)
@@ -106,35 +201,25 @@ class ImageDCTExtractor(Extractor):
             raise ValueError("Unable to read image")
         y_channel = cv2.cvtColor(stego, cv2.COLOR_BGR2YCrCb)[:, :, 0].astype(np.float32)
 
-        bits: List[int] = []
-        for y_slice, x_slice in _iter_blocks(y_channel):
-            block = y_channel[y_slice, x_slice]
-            dct_block = cv2.dct(block)
-            coords = [(2, 1), (1, 2), (2, 2), (3, 1), (1, 3)]
-            for (i, j) in coords:
-                coeff = dct_block[i, j]
-                bits.append(int(abs(coeff) % 2))
-                if len(bits) >= 32:
-                    break
-            if len(bits) >= 32:
-                break
-
-        payload_length = int("".join(map(str, bits[:32])), 2)
-        data_bits: List[int] = []
-        count_required = payload_length * 8
-        for y_slice, x_slice in _iter_blocks(y_channel):
-            block = y_channel[y_slice, x_slice]
-            dct_block = cv2.dct(block)
-            coords = [(2, 1), (1, 2), (2, 2), (3, 1), (1, 3)]
-            for (i, j) in coords:
-                data_bits.append(int(abs(dct_block[i, j]) % 2))
-                if len(data_bits) >= 32 + count_required:
-                    break
-            if len(data_bits) >= 32 + count_required:
-                break
-
-        data_bits = data_bits[32 : 32 + count_required]
-        recovered = int("".join(map(str, data_bits)), 2).to_bytes(payload_length, "big")
+        if _is_ragged(y_channel):
+            header = _ragged_bits(y_channel, _HEADER_BITS)
+            payload_length = int.from_bytes(bits_to_bytes(header), "big")
+            total_bits = _HEADER_BITS + payload_length * 8
+            bits = _ragged_bits(y_channel, total_bits)
+            recovered = bits_to_bytes(bits[_HEADER_BITS:])
+        else:
+            tiles = _tile(y_channel)
+            # Decode the header blocks once and keep their spare bits; only the
+            # remaining blocks are transformed after.
+            header_blocks = -(-_HEADER_BITS // len(_COORDS))
+            leading = _midband_bits(tiles[:header_blocks], header_blocks * len(_COORDS))
+            header = leading[:_HEADER_BITS]
+            payload_length = int.from_bytes(bits_to_bytes(header), "big")
+            total_bits = _HEADER_BITS + payload_length * 8
+            rest = max(0, total_bits - leading.size)
+            trailing = _midband_bits(tiles[header_blocks:], rest)
+            bits = np.concatenate((leading, trailing))
+            recovered = bits_to_bytes(bits[_HEADER_BITS:total_bits])
 
         result = {
             "payload_length": payload_length,
@@ -155,11 +240,16 @@ class ImageDCTDetector(Detector):
             raise ValueError("Unable to read image")
         y_channel = cv2.cvtColor(stego, cv2.COLOR_BGR2YCrCb)[:, :, 0].astype(np.float32)
 
-        residuals = []
-        for y_slice, x_slice in _iter_blocks(y_channel):
-            dct_block = cv2.dct(y_channel[y_slice, x_slice])
-            residuals.append(np.var(dct_block[1:4, 1:4]))
-        variance = float(np.mean(residuals))
+        if _is_ragged(y_channel):
+            # Partial edge blocks count too, as in the original traversal.
+            residuals = [
+                np.var(cv2.dct(y_channel[y_slice, x_slice])[1:4, 1:4])
+                for y_slice, x_slice in _iter_blocks(y_channel)
+            ]
+            variance = float(np.mean(residuals))
+        else:
+            band = _forward_band(_tile(y_channel))
+            variance = float(band.reshape(len(band), -1).var(axis=1).mean())
         probability = float(1 / (1 + np.exp(-(variance - 12) / 4)))
         result = {
             "variance": variance,
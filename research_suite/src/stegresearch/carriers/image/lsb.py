@@ -5,11 +5,12 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable
 
 import numpy as np
 from PIL import Image
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 from ...core.metrics import image_arrays, psnr, ssim
@@ -17,15 +18,6 @@ from ...core.metrics import image_arrays, psnr, ssim
 _HEADER_LENGTH = 32  # bits storing payload size
 
 
-def _bytes_to_bits(payload: bytes) -> List[int]:
-    return [int(bit) for byte in payload for bit in f"{byte:08b}"]
-
-
-def _bits_to_bytes(bits: Iterable[int]) -> bytes:
-    bit_str = "".join(str(bit) for bit in bits)
-    return int(bit_str, 2).to_bytes(len(bit_str) // 8, byteorder="big")
-
-
 @dataclass
 class ImageLSBEmbedder(Embedder):
     name: str = "lsb"
@@ -46,22 +38,25 @@ class ImageLSBEmbedder(Embedder):
             raise ValueError("Unsupported LSB method")
 
         cover = Image.open(carrier_path).convert("RGB")
-        cover_array = np.array(cover)
-        flat = cover_array.flatten()
+        width, height = cover.size
 
         payload_length = len(payload)
-        length_bits = _bytes_to_bits(payload_length.to_bytes(4, "big"))
-        payload_bits = _bytes_to_bits(payload)
-        data_bits = length_bits + payload_bits
+        data_bits = bytes_to_bits(payload_length.to_bytes(4, "big") + payload)
+        n = data_bits.size
 
-        if len(data_bits) > len(flat):
+        if n > width * height * 3:
             raise ValueError("Payload too large for cover image")
 
-        for idx, bit in enumerate(data_bits):
-            flat[idx] = (flat[idx] & 0xFE) | bit
+        # Only the leading rows carry bits: patch a copy of that band and paste it over
+        # the converted cover.
+        rows = -(-n // (width * 3))
+        band = np.array(cover.crop((0, 0, width, rows)))
+        flat = band.reshape(-1)
+        flat[:n] &= np.uint8(0xFE)
+        flat[:n] |= data_bits
+        cover.paste(Image.fromarray(band), (0, 0))
 
-        stego_array = flat.reshape(cover_array.shape)
-        stego_image = Image.fromarray(stego_array.astype(np.uint8))
+        stego_image = cover
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         stego_image.save(output_path)
 
@@ -100,13 +95,13 @@ class ImageLSBExtractor(Extractor):
             raise ValueError("Unsupported LSB method")
 
         stego = Image.open(stego_path).convert("RGB")
-        flat = np.array(stego).flatten()
+        flat = np.frombuffer(stego.tobytes(), dtype=np.uint8)
 
         length_bits = flat[:_HEADER_LENGTH] & 1
-        payload_length = int("".join(str(bit) for bit in length_bits), 2)
+        payload_length = int.from_bytes(bits_to_bytes(length_bits), "big")
         payload_bits = flat[_HEADER_LENGTH : _HEADER_LENGTH + payload_length * 8] & 1
 
-        recovered = _bits_to_bytes(payload_bits)
+        recovered = bits_to_bytes(payload_bits)
 
         metrics = {
             "payload_length": payload_length,
@@ -124,17 +119,19 @@ class ImageLSBDetector(Detector):
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
         stego = Image.open(stego_path).convert("RGB")
-        data = np.array(stego)
-        channel = data[:, :, 0].flatten()
-
-        even_counts = np.bincount(channel[channel % 2 == 0], minlength=256)
-        odd_counts = np.bincount(channel[channel % 2 == 1], minlength=256)
-        chi_square = 0.0
-        for even, odd in zip(even_counts, odd_counts):
-            if even + odd == 0:
-                continue
-            expected = (even + odd) / 2
-            chi_square += ((even - expected) ** 2 + (odd - expected) ** 2) / expected
+        channel = np.frombuffer(stego.tobytes(), dtype=np.uint8)[0::3]
+
+        # Index parity equals value parity, so one histogram yields the (2k, 2k + 1)
+        # pairs of values.
+        counts = np.bincount(channel, minlength=256)
+        even_counts = counts[0::2]
+        odd_counts = counts[1::2]
+        total = even_counts + odd_counts
+        mask = total > 0
+        expected = total[mask] / 2
+        even_dev = (even_counts[mask] - expected) ** 2
+        odd_dev = (odd_counts[mask] - expected) ** 2
+        chi_square = float(((even_dev + odd_dev) / expected).sum())
 
         score = 1 / (1 + math.exp(-(chi_square - 128) / 32))
 
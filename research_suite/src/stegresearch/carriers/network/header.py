@@ -2,26 +2,129 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
 
+import numpy as np
 from scapy.all import IP, Packet, rdpcap, wrpcap  # type: ignore
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 
 _HEADER_BITS = 16
 
-
-def _bytes_to_bits(payload: bytes) -> List[int]:
-    return [int(bit) for byte in payload for bit in f"{byte:08b}"]
-
-
-def _bits_to_bytes(bits: List[int]) -> bytes:
-    bit_str = "".join(str(bit) for bit in bits)
-    groups = [bit_str[i : i + 8] for i in range(0, len(bit_str), 8) if len(bit_str[i : i + 8]) == 8]
-    return bytes(int(group, 2) for group in groups)
+# Classic libpcap magics (microsecond and nanosecond) mapped to their byte order;
+# pcapng goes through scapy.
+_PCAP_BYTE_ORDER = {
+    b"\xd4\xc3\xb2\xa1": "<",
+    b"\xa1\xb2\xc3\xd4": ">",
+    b"\x4d\x3c\xb2\xa1": "<",
+    b"\xa1\xb2\x3c\x4d": ">",
+}
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_RAW = (101, 228)
+_LINKTYPE_LINUX_SLL = 113
+_ETHERTYPE_IPV4 = 0x0800
+_ETHERTYPE_VLAN = (0x8100, 0x88A8)
+
+
+def _ipv4_offset(frame: memoryview, linktype: int) -> Optional[int]:
+    """Return the offset of the outer IPv4 header in ``frame``, if it carries one."""
+
+    if linktype == _LINKTYPE_ETHERNET:
+        offset = 12
+        while offset + 2 <= len(frame):
+            (ethertype,) = struct.unpack_from("!H", frame, offset)
+            if ethertype not in _ETHERTYPE_VLAN:
+                break
+            offset += 4
+        else:
+            return None
+        if ethertype != _ETHERTYPE_IPV4:
+            return None
+        offset += 2
+    elif linktype == _LINKTYPE_LINUX_SLL:
+        if len(frame) < 16 or struct.unpack_from("!H", frame, 14)[0] != _ETHERTYPE_IPV4:
+            return None
+        offset = 16
+    elif linktype in _LINKTYPE_RAW:
+        offset = 0
+    else:
+        return None
+    if len(frame) < offset + 20 or frame[offset] >> 4 != 4:
+        return None
+    return offset
+
+
+def _ipv4_checksum(header: memoryview) -> int:
+    total = sum(struct.unpack(f"!{len(header) // 2}H", header))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _patch_pcap_ip_ids(
+    data: bytearray, bits: Sequence[int]
+) -> Optional[Tuple[int, int]]:
+    """Write ``bits`` into the IP-id LSBs of a classic pcap buffer in place.
+
+    Only the id and checksum bytes of the touched headers change; every other byte is
+    kept verbatim. Returns ``(bits_written, packet_count)``, or ``None`` when the
+    capture needs scapy to dissect it.
+    """
+
+    order = _PCAP_BYTE_ORDER.get(bytes(data[:4]))
+    if order is None or len(data) < 24:
+        return None
+    (linktype,) = struct.unpack_from(f"{order}I", data, 20)
+    if linktype not in (_LINKTYPE_ETHERNET, _LINKTYPE_LINUX_SLL, *_LINKTYPE_RAW):
+        return None
+
+    view = memoryview(data)
+    record = struct.Struct(f"{order}IIII")
+    offset = 24
+    idx = 0
+    packet_count = 0
+    while offset + record.size <= len(data):
+        _, _, captured, _ = record.unpack_from(data, offset)
+        start = offset + record.size
+        offset = start + captured
+        packet_count += 1
+        if idx >= len(bits):
+            continue
+        ip = _ipv4_offset(view[start:offset], linktype)
+        if ip is None:
+            continue
+        ip += start
+        (ip_id,) = struct.unpack_from("!H", data, ip + 4)
+        patched = (ip_id & ~1) | bits[idx]
+        idx += 1
+        if patched == ip_id:
+            continue
+        struct.pack_into("!H", data, ip + 4, patched)
+        struct.pack_into("!H", data, ip + 10, 0)
+        header_length = (data[ip] & 0x0F) * 4
+        checksum = _ipv4_checksum(view[ip : ip + header_length])
+        struct.pack_into("!H", data, ip + 10, checksum)
+    view.release()
+    return idx, packet_count
+
+
+def _is_ipv4(packet: Packet) -> bool:
+    # Raw-IP captures dissect every frame as IP, so IPv6 frames need the version check.
+    return IP in packet and packet[IP].version == 4
+
+
+def _ip_id_bits(packets: Any) -> np.ndarray:
+    """Return the IP-id LSB of every IPv4 packet as a ``uint8`` array."""
+
+    ids = np.fromiter(
+        (packet[IP].id for packet in packets if _is_ipv4(packet)), dtype=np.uint16
+    )
+    return (ids & 1).astype(np.uint8)
 
 
 @dataclass
@@ -36,25 +139,37 @@ class NetworkHeaderEmbedder(Embedder):
         if method != "ip-id-lsb":
             raise ValueError("Unsupported method")
 
-        packets = rdpcap(str(carrier_path))
-        payload_bits = _bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
-        idx = 0
-        for packet in packets:
-            if not packet.haslayer(IP):
-                continue
-            ip: IP = packet[IP]
-            ip.id = (ip.id & ~1) | payload_bits[idx]
-            idx += 1
-            if idx >= len(payload_bits):
-                break
-        if idx < len(payload_bits):
-            raise ValueError("Payload too large for pcap")
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        wrpcap(str(output_path), packets)
+        payload_bits = bytes_to_bits(len(payload).to_bytes(4, "big") + payload).tolist()
+        data = bytearray(Path(carrier_path).read_bytes())
+        patched = _patch_pcap_ip_ids(data, payload_bits)
+        if patched is not None:
+            idx, packet_count = patched
+            if idx < len(payload_bits):
+                raise ValueError("Payload too large for pcap")
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(data)
+        else:
+            packets = rdpcap(str(carrier_path))
+            idx = 0
+            for packet in packets:
+                if not _is_ipv4(packet):
+                    continue
+                ip: IP = packet[IP]
+                ip.id = (ip.id & ~1) | payload_bits[idx]
+                # Dissected packets keep their parsed checksum; clear it to recompute.
+                del ip.chksum
+                idx += 1
+                if idx >= len(payload_bits):
+                    break
+            if idx < len(payload_bits):
+                raise ValueError("Payload too large for pcap")
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            wrpcap(str(output_path), packets)
+            packet_count = len(packets)
         metrics = {
             "payload_length": len(payload),
             "capacity_bits": len(payload_bits),
-            "packet_count": len(packets),
+            "packet_count": packet_count,
         }
         log_operation("network_header_embed", carrier_path=str(carrier_path), **metrics)
         return metrics
@@ -71,16 +186,10 @@ class NetworkHeaderExtractor(Extractor):
     def extract(self, method: str, stego_path: str, **options: Any) -> Dict[str, Any]:
         if method != "ip-id-lsb":
             raise ValueError("Unsupported method")
-        packets = rdpcap(str(stego_path))
-        bits: List[int] = []
-        for packet in packets:
-            if not packet.haslayer(IP):
-                continue
-            ip: IP = packet[IP]
-            bits.append(ip.id & 1)
-        payload_length = int("".join(map(str, bits[:32])), 2)
+        bits = _ip_id_bits(rdpcap(str(stego_path)))
+        payload_length = int.from_bytes(bits_to_bytes(bits[:32]), "big")
         payload_bits = bits[32 : 32 + payload_length * 8]
-        payload = _bits_to_bytes(payload_bits)
+        payload = bits_to_bytes(payload_bits)
         result = {
             "payload_length": payload_length,
             "payload": payload,
@@ -95,14 +204,9 @@ class NetworkHeaderDetector(Detector):
     carrier: str = "network"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        packets = rdpcap(str(stego_path))
-        bits = []
-        for packet in packets:
-            if not packet.haslayer(IP):
-                continue
-            bits.append(packet[IP].id & 1)
-        ones = sum(bits)
-        total = len(bits) or 1
+        bits = _ip_id_bits(rdpcap(str(stego_path)))
+        ones = int(bits.sum())
+        total = bits.size or 1
         bias = abs(ones / total - 0.5)
         probability = float(min(1.0, bias * 8))
         result = {
@@ -4,13 +4,41 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, cast
 
+import numpy as np
 from scapy.all import Packet, rdpcap, wrpcap  # type: ignore
+from scapy.utils import RawPcapNgReader, RawPcapReader  # type: ignore
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 
+_NANOSECONDS = 10**9
+
+
+def _capture_gaps(path: str) -> np.ndarray:
+    """Return the inter-packet gaps in seconds.
+
+    Gaps are read from the record timestamps without dissecting packets.
+    """
+
+    with RawPcapReader(path) as reader:
+        if isinstance(reader, RawPcapNgReader):
+            # scapy annotates the pcapng reader as yielding classic pcap metadata.
+            ng_meta = (cast(Any, meta) for _, meta in reader)
+            stamps = (
+                ((meta.tshigh << 32) | meta.tslow) * _NANOSECONDS // meta.tsresol
+                for meta in ng_meta
+            )
+        else:
+            scale = 1 if reader.nano else 1000
+            stamps = (meta.sec * _NANOSECONDS + meta.usec * scale for _, meta in reader)
+        # Integer nanoseconds keep the gaps exact; a gap equal to base_gap must not
+        # drift above it.
+        nanoseconds = np.fromiter(stamps, dtype=np.int64)
+    return np.diff(nanoseconds) / _NANOSECONDS
+
 
 @dataclass
 class NetworkTimingEmbedder(Embedder):
@@ -27,7 +55,7 @@ class NetworkTimingEmbedder(Embedder):
         packets = rdpcap(str(carrier_path))
         base_gap = float(options.get("base_gap", 0.01))
         delta = float(options.get("delta", 0.002))
-        bits = [int(bit) for byte in payload for bit in f"{byte:08b}"]
+        bits = bytes_to_bits(payload)
 
         if len(bits) > len(packets) - 1:
             raise ValueError("Payload too large for timing embedding")
@@ -64,15 +92,10 @@ class NetworkTimingExtractor(Extractor):
         if method != "inter-packet-gap":
             raise ValueError("Unsupported method")
 
-        packets = rdpcap(str(stego_path))
-        deltas: List[float] = []
-        for prev, curr in zip(packets, packets[1:]):
-            deltas.append(curr.time - prev.time)
+        deltas = _capture_gaps(str(stego_path))
         base_gap = float(options.get("base_gap", 0.01))
         delta = float(options.get("delta", 0.002))
-        bits = [1 if gap > base_gap else 0 for gap in deltas]
-        bitstring = "".join(str(bit) for bit in bits)
-        payload = int(bitstring, 2).to_bytes(len(bitstring) // 8, "big") if len(bitstring) >= 8 else b""
+        payload = bits_to_bytes(deltas > base_gap)
         result = {
             "payload": payload,
             "payload_length": len(payload),
@@ -87,11 +110,10 @@ class NetworkTimingDetector(Detector):
     carrier: str = "network"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        packets = rdpcap(str(stego_path))
-        deltas = [curr.time - prev.time for prev, curr in zip(packets, packets[1:])]
-        if not deltas:
+        deltas = _capture_gaps(str(stego_path))
+        if not deltas.size:
             return {"probability": 0.0, "threshold_flag": False, "variance": 0.0}
-        variance = float(sum((gap - sum(deltas) / len(deltas)) ** 2 for gap in deltas) / len(deltas))
+        variance = float(deltas.var())
         probability = min(1.0, variance * 50)
         result = {
             "variance": variance,
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, Iterable
 
+from ...core.bits import bitstring_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 
 BIT_TO_GAP = {"0": "  ", "1": " \t"}
+_GAP_BYTES = (BIT_TO_GAP["0"].encode("ascii"), BIT_TO_GAP["1"].encode("ascii"))
+# Byte-level line endings the detector looks for, including CRLF files that text mode
+# would have normalized.
+_GAP_ENDINGS = (b"  \n", b" \t\n", b"  \r\n", b" \t\r\n")
 
 
 @dataclass
@@ -23,22 +29,18 @@ class WhitespaceEmbedder(Embedder):
         if method != "trailing-whitespace":
             raise ValueError("Unsupported method")
 
-        with open(carrier_path, "r", encoding="utf-8") as handle:
-            lines = handle.readlines()
-        bitstring = "".join(f"{byte:08b}" for byte in payload)
-        if len(bitstring) > len(lines):
+        # Gaps are ASCII, so the carrier is handled as bytes; splitlines() matches text
+        # mode's universal newlines.
+        lines = Path(carrier_path).read_bytes().splitlines()
+        bits = bytes_to_bits(payload)
+        if len(bits) > len(lines):
             raise ValueError("Payload too large for whitespace embedding")
-        stego_lines = []
-        for index, line in enumerate(lines):
-            line = line.rstrip("\n")
-            if index < len(bitstring):
-                line = f"{line}{BIT_TO_GAP[bitstring[index]]}"
-            stego_lines.append(line + "\n")
-        with open(output_path, "w", encoding="utf-8") as handle:
-            handle.writelines(stego_lines)
+        gapped = [line + _GAP_BYTES[bit] for line, bit in zip(lines, bits.tolist())]
+        stego = b"\n".join(gapped + lines[len(gapped) :])
+        Path(output_path).write_bytes(stego + b"\n" if lines else stego)
         metrics = {
             "payload_length": len(payload),
-            "capacity_bits": len(bitstring),
+            "capacity_bits": len(bits),
         }
         log_operation("text_whitespace_embed", carrier_path=carrier_path, **metrics)
         return metrics
@@ -65,7 +67,7 @@ class WhitespaceExtractor(Extractor):
             elif line.endswith("  \n"):
                 bits.append("0")
         bitstring = "".join(bits)
-        payload = int(bitstring, 2).to_bytes(len(bitstring) // 8, "big") if len(bitstring) >= 8 else b""
+        payload = bitstring_to_bytes(bitstring)
         result = {
             "payload": payload,
             "payload_length": len(payload),
@@ -80,10 +82,11 @@ class WhitespaceDetector(Detector):
     carrier: str = "text"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        with open(stego_path, "r", encoding="utf-8") as handle:
-            lines = handle.readlines()
-        suspicious = sum(1 for line in lines if line.endswith("  \n") or line.endswith(" \t\n"))
-        ratio = suspicious / max(len(lines), 1)
+        # Byte-level substring counts: no UTF-8 decode and no per-line string objects.
+        data = Path(stego_path).read_bytes()
+        suspicious = sum(data.count(ending) for ending in _GAP_ENDINGS)
+        line_count = data.count(b"\n") + (data[-1:] not in (b"", b"\n"))
+        ratio = suspicious / max(line_count, 1)
         probability = min(1.0, ratio * 5)
         result = {
             "ratio": ratio,
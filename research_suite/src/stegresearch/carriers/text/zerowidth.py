@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, Iterable
 
+import numpy as np
+
+from ...core.bits import bitstring_to_bytes, bytes_to_bitstring
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
 
@@ -12,14 +16,10 @@ ZERO_WIDTH_SPACE = "\u200b"
 ZERO_WIDTH_NON_JOINER = "\u200c"
 PAYLOAD_PREFIX = "[ZW-HIDDEN]"
 PAYLOAD_SUFFIX = "[END]"
-
-
-def _bytes_to_bits(payload: bytes) -> str:
-    return "".join(f"{byte:08b}" for byte in payload)
-
-
-def _bits_to_bytes(bits: str) -> bytes:
-    return int(bits, 2).to_bytes(len(bits) // 8, "big") if bits else b""
+_ZERO_WIDTH_BYTES = (
+    ZERO_WIDTH_SPACE.encode("utf-8"),
+    ZERO_WIDTH_NON_JOINER.encode("utf-8"),
+)
 
 
 @dataclass
@@ -37,7 +37,7 @@ class ZeroWidthEmbedder(Embedder):
         with open(carrier_path, "r", encoding="utf-8") as handle:
             cover = handle.read()
 
-        bitstring = _bytes_to_bits(payload)
+        bitstring = bytes_to_bitstring(payload)
         encoded = bitstring.replace("0", ZERO_WIDTH_SPACE).replace("1", ZERO_WIDTH_NON_JOINER)
         stego = f"{cover}{PAYLOAD_PREFIX}{encoded}{PAYLOAD_SUFFIX}"
 
@@ -72,7 +72,7 @@ class ZeroWidthExtractor(Extractor):
             return {"payload": b"", "payload_length": 0}
         hidden = stego[start + len(PAYLOAD_PREFIX) : end]
         bitstring = hidden.replace(ZERO_WIDTH_SPACE, "0").replace(ZERO_WIDTH_NON_JOINER, "1")
-        payload = _bits_to_bytes(bitstring)
+        payload = bitstring_to_bytes(bitstring)
         result = {
             "payload": payload,
             "payload_length": len(payload),
@@ -87,10 +87,15 @@ class ZeroWidthDetector(Detector):
     carrier: str = "text"
 
     def detect(self, stego_path: str, **options: Any) -> Dict[str, Any]:
-        with open(stego_path, "r", encoding="utf-8") as handle:
-            data = handle.read()
-        total = len(data)
-        zero_width_count = data.count(ZERO_WIDTH_SPACE) + data.count(ZERO_WIDTH_NON_JOINER)
+        data = Path(stego_path).read_bytes()
+        # Character count of the decoded text: every byte except UTF-8 continuation
+        # bytes, with CRLF read as one.
+        raw = np.frombuffer(data, dtype=np.uint8)
+        continuation = np.count_nonzero(raw & 0xC0 == 0x80)
+        total = len(data) - int(continuation) - data.count(b"\r\n")
+        # UTF-8 is prefix-free, so counting the encoded sequences matches counting the
+        # characters.
+        zero_width_count = sum(data.count(sequence) for sequence in _ZERO_WIDTH_BYTES)
         ratio = zero_width_count / max(total, 1)
         probability = min(1.0, ratio * 200)
         result = {
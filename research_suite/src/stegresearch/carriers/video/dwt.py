@@ -10,21 +10,63 @@ import cv2
 import numpy as np
 import pywt
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
+from .pipeline import FrameReader, FrameWriter, limit_buffering, open_writer
 
 _HEADER_BITS = 32
-
-
-def _bytes_to_bits(payload: bytes) -> List[int]:
-    return [int(bit) for byte in payload for bit in f"{byte:08b}"]
-
-
-def _bits_to_bytes(bits: List[int]) -> bytes:
-    bit_str = "".join(str(bit) for bit in bits)
-    if len(bit_str) % 8:
-        bit_str = bit_str[: len(bit_str) - (len(bit_str) % 8)]
-    return int(bit_str, 2).to_bytes(len(bit_str) // 8, "big") if bit_str else b""
+_LEVELS = 2
+_HAAR = np.float32(pywt.Wavelet("haar").dec_lo[0])
+# Frames transformed per pywt call; amortizes its per-call dispatch without holding
+# much video in memory.
+_BATCH_FRAMES = 16
+
+
+def _haar_ll(plane: np.ndarray) -> np.ndarray:
+    """Return the level-2 Haar approximation band of ``plane``.
+
+    The result is bit-identical to ``pywt.wavedec2(...)[0]`` but skips the detail bands
+    pywt computes and discards; rows are filtered before columns and odd edges are
+    extended symmetrically, matching pywt's float32 rounding exactly.
+    """
+
+    ll = plane
+    for _ in range(_LEVELS):
+        rows, cols = ll.shape
+        if rows % 2 or cols % 2:
+            ll = np.pad(ll, ((0, rows % 2), (0, cols % 2)), mode="symmetric")
+        ll = ll[0::2] * _HAAR + ll[1::2] * _HAAR
+        ll = ll[:, 0::2] * _HAAR + ll[:, 1::2] * _HAAR
+    return ll
+
+
+def _embed_batch(
+    yuv: np.ndarray, luma: np.ndarray, payload_bits: np.ndarray, bit_idx: int
+) -> int:
+    """Write payload bits from ``bit_idx`` into the LL bands of a YUV stack in place.
+
+    ``yuv`` is shaped ``(frames, h, w, 3)`` and ``luma`` is float32 scratch space
+    shaped like its Y plane. Returns the next unwritten bit index.
+    """
+
+    np.copyto(luma, yuv[..., 0])
+    coeffs = pywt.wavedecn(luma, "haar", level=_LEVELS, axes=(1, 2))
+    # Frames are consecutive along axis 0, so a flat view keeps the per-frame,
+    # row-major bit order.
+    flat = coeffs[0].reshape(-1)
+    chunk = min(flat.size, payload_bits.size - bit_idx)
+    bits = payload_bits[bit_idx : bit_idx + chunk]
+    flat[:chunk] = np.floor(flat[:chunk] / 2) * 2 + bits
+    coeffs[0] = flat.reshape(coeffs[0].shape)
+    reconstructed = pywt.waverecn(coeffs, "haar", axes=(1, 2))
+    yuv[..., 0] = np.clip(reconstructed, 0, 255, out=reconstructed)
+    return bit_idx + chunk
+
+
+def _write_batch(sink: FrameWriter, yuv: np.ndarray) -> None:
+    for converted in yuv:
+        sink.write(cv2.cvtColor(converted, cv2.COLOR_YUV2BGR))
 
 
 @dataclass
@@ -52,44 +94,45 @@ class VideoDWTEmbedder(Embedder):
         fps = cap.get(cv2.CAP_PROP_FPS) or 25
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        codec = cv2.VideoWriter_fourcc(*"mp4v")
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        writer = cv2.VideoWriter(output_path, codec, fps, (width, height))
+        writer = open_writer(output_path, fps, (width, height))
 
-        payload_bits = _bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
+        payload_bits = bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
         bit_idx = 0
         frames = 0
 
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            frames += 1
-            yuv = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV)
-            y_channel = yuv[:, :, 0].astype(np.float32)
-            coeffs = pywt.wavedec2(y_channel, "haar", level=2)
-            ll, *rest = coeffs
-            flat = ll.flatten()
-            for i in range(len(flat)):
-                if bit_idx >= len(payload_bits):
-                    break
-                flat[i] = np.floor(flat[i] / 2) * 2 + payload_bits[bit_idx]
-                bit_idx += 1
-            ll = flat.reshape(ll.shape)
-            coeffs = [ll] + rest
-            y_reconstructed = pywt.waverec2(coeffs, "haar")
-            yuv[:, :, 0] = np.clip(y_reconstructed, 0, 255)
-            frame = cv2.cvtColor(yuv.astype(np.uint8), cv2.COLOR_YUV2BGR)
-            writer.write(frame)
-        cap.release()
-        writer.release()
-
-        if bit_idx < len(payload_bits):
+        # Frames are converted into a reused YUV stack and transformed a batch at a
+        # time. The BGR output stays per-frame because the writer queues it.
+        yuv: np.ndarray | None = None
+        luma: np.ndarray | None = None
+        pending = 0
+        with FrameReader(cap) as frame_source, FrameWriter(writer) as sink:
+            for frame in frame_source:
+                if yuv is None:
+                    yuv = np.empty((_BATCH_FRAMES, *frame.shape), dtype=np.uint8)
+                    luma = np.empty(yuv.shape[:3], dtype=np.float32)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2YUV, dst=yuv[pending])
+                pending += 1
+                frames += 1
+                if pending == _BATCH_FRAMES:
+                    assert luma is not None
+                    bit_idx = _embed_batch(yuv, luma, payload_bits, bit_idx)
+                    _write_batch(sink, yuv)
+                    pending = 0
+            if pending:
+                # Only reachable after the first frame allocated both stacks.
+                assert yuv is not None and luma is not None
+                bit_idx = _embed_batch(
+                    yuv[:pending], luma[:pending], payload_bits, bit_idx
+                )
+                _write_batch(sink, yuv[:pending])
+
+        if bit_idx < payload_bits.size:
             raise ValueError("Payload too large for DWT embedding")
 
         metrics = {
             "frames": frames,
-            "capacity_bits": len(payload_bits),
+            "capacity_bits": int(payload_bits.size),
             "payload_length": len(payload),
         }
         log_operation("video_dwt_embed", carrier_path=carrier_path, **metrics)
@@ -111,27 +154,44 @@ class VideoDWTExtractor(Extractor):
         cap = cv2.VideoCapture(stego_path)
         if not cap.isOpened():
             raise ValueError("Unable to open video")
+        limit_buffering(cap)
 
-        bits: List[int] = []
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        bit_chunks: List[np.ndarray] = []
+        total_bits_seen = 0
+        required_bits: int | None = None
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
             yuv = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV)
             y_channel = yuv[:, :, 0].astype(np.float32)
-            coeffs = pywt.wavedec2(y_channel, "haar", level=2)
+            coeffs = pywt.wavedec2(y_channel, "haar", level=_LEVELS)
             ll = coeffs[0]
-            bits.extend((ll.flatten() % 2).astype(int))
-            if len(bits) >= _HEADER_BITS:
-                payload_length = int("".join(map(str, bits[:_HEADER_BITS])), 2)
-                total = _HEADER_BITS + payload_length * 8
-                if len(bits) >= total:
-                    break
+            chunk = (ll.ravel().astype(np.int64) & 1).astype(np.uint8)
+            bit_chunks.append(chunk)
+            total_bits_seen += chunk.size
+
+            if required_bits is None and total_bits_seen >= _HEADER_BITS:
+                header_bits = np.concatenate(bit_chunks)[:_HEADER_BITS]
+                header = np.packbits(header_bits).tobytes()
+                payload_length = int.from_bytes(header, "big")
+                required_bits = _HEADER_BITS + payload_length * 8
+                if frame_count > 0 and required_bits > frame_count * chunk.size:
+                    cap.release()
+                    raise ValueError("Embedded payload length exceeds video capacity")
+
+            if required_bits is not None and total_bits_seen >= required_bits:
+                break
         cap.release()
 
-        payload_length = int("".join(map(str, bits[:_HEADER_BITS])), 2)
-        payload_bits = bits[_HEADER_BITS : _HEADER_BITS + payload_length * 8]
-        payload = _bits_to_bytes(payload_bits)
+        if not bit_chunks:
+            raise ValueError("Unable to read frames for extraction")
+
+        bits = np.concatenate(bit_chunks)
+        header = np.packbits(bits[:_HEADER_BITS]).tobytes()
+        payload_length = int.from_bytes(header, "big")
+        payload = bits_to_bytes(bits[_HEADER_BITS : _HEADER_BITS + payload_length * 8])
         result = {
             "payload_length": payload_length,
             "payload": payload,
@@ -149,16 +209,16 @@ class VideoDWTDetector(Detector):
         cap = cv2.VideoCapture(stego_path)
         if not cap.isOpened():
             raise ValueError("Unable to open video")
+        limit_buffering(cap)
         residuals = []
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
             yuv = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV)
-            y_channel = yuv[:, :, 0].astype(np.float32)
-            coeffs = pywt.wavedec2(y_channel, "haar", level=2)
-            ll = coeffs[0]
-            residuals.append(np.var(ll % 1))
+            ll = _haar_ll(yuv[:, :, 0].astype(np.float32))
+            ll -= np.floor(ll)
+            residuals.append(float(ll.var(dtype=np.float32)))
         cap.release()
         statistic = float(np.mean(residuals)) if residuals else 0.0
         probability = float(min(1.0, statistic * 20))
@@ -5,38 +5,19 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List
 
 import cv2
 import numpy as np
 
+from ...core.bits import bits_to_bytes, bytes_to_bits
 from ...core.interfaces import Detector, Embedder, Extractor
 from ...core.logging import log_operation
+from .pipeline import FrameReader, FrameWriter, limit_buffering, open_writer
 
 _HEADER_BITS = 32
 
 
-def _bytes_to_bits(payload: bytes) -> np.ndarray:
-    if not payload:
-        return np.empty(0, dtype=np.uint8)
-    return np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
-
-
-def _bits_to_bytes(bits: Sequence[int] | np.ndarray) -> bytes:
-    if isinstance(bits, np.ndarray):
-        bit_array = bits.astype(np.uint8, copy=False)
-    else:
-        bit_array = np.fromiter(bits, dtype=np.uint8)
-
-    if bit_array.size == 0:
-        return b""
-
-    usable = bit_array.size - (bit_array.size % 8)
-    if usable != bit_array.size:
-        bit_array = bit_array[:usable]
-    return np.packbits(bit_array).tobytes()
-
-
 @dataclass
 class VideoFrameLSBEmbedder(Embedder):
     name: str = "frame-lsb"
@@ -90,46 +71,46 @@ class VideoFrameLSBEmbedder(Embedder):
             target_width = max(2, scale_width)
             target_height = max(2, int(round(source_height * (target_width / source_width))))
 
-        codec = cv2.VideoWriter_fourcc(*"mp4v")
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        writer = cv2.VideoWriter(output_path, codec, fps, (target_width, target_height))
+        writer = open_writer(output_path, fps, (target_width, target_height))
 
-        payload_bits = _bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
+        payload_bits = bytes_to_bits(len(payload).to_bytes(4, "big") + payload)
         total_bits = payload_bits.size
         idx = 0
         frame_count = 0
         embedded_frames = 0
         truncated = False
 
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            frame_count += 1
-
-            if target_width != source_width or target_height != source_height:
-                frame = cv2.resize(frame, (target_width, target_height), interpolation=cv2.INTER_AREA)
-
-            should_embed = idx < total_bits and ((frame_count - 1) % frame_step == 0)
-            if should_embed:
-                embedded_frames += 1
-                flat = frame.reshape(-1)
-                remaining = total_bits - idx
-                if remaining > 0:
-                    chunk = min(flat.size, remaining)
-                    slice_view = flat[:chunk]
-                    slice_view &= 0xFE
-                    slice_view |= payload_bits[idx : idx + chunk]
-                    idx += chunk
-
-            writer.write(frame)
-
-            if max_frames is not None and embedded_frames >= max_frames and idx >= total_bits:
-                truncated = True
-                break
-
-        cap.release()
-        writer.release()
+        with FrameReader(cap) as frames, FrameWriter(writer) as sink:
+            for frame in frames:
+                frame_count += 1
+
+                if target_width != source_width or target_height != source_height:
+                    frame = cv2.resize(
+                        frame,
+                        (target_width, target_height),
+                        interpolation=cv2.INTER_AREA,
+                    )
+
+                on_step = (frame_count - 1) % frame_step == 0
+                should_embed = idx < total_bits and on_step
+                if should_embed:
+                    embedded_frames += 1
+                    flat = frame.reshape(-1)
+                    remaining = total_bits - idx
+                    if remaining > 0:
+                        chunk = min(flat.size, remaining)
+                        slice_view = flat[:chunk]
+                        slice_view &= 0xFE
+                        slice_view |= payload_bits[idx : idx + chunk]
+                        idx += chunk
+
+                sink.write(frame)
+
+                capped = max_frames is not None and embedded_frames >= max_frames
+                if capped and idx >= total_bits:
+                    truncated = True
+                    break
 
         if idx < total_bits:
             raise ValueError("Payload too large for video")
@@ -166,37 +147,62 @@ class VideoFrameLSBExtractor(Extractor):
         cap = cv2.VideoCapture(stego_path)
         if not cap.isOpened():
             raise ValueError("Unable to open video")
+        limit_buffering(cap)
 
-        bit_chunks: List[np.ndarray] = []
-        total_bits_seen = 0
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        pending: List[np.ndarray] = []
+        bits: np.ndarray | None = None
+        write_pos = 0
         required_bits: int | None = None
-        while True:
+        while required_bits is None or write_pos < required_bits:
             ret, frame = cap.read()
             if not ret:
                 break
-            chunk = (frame.reshape(-1) & 1).astype(np.uint8, copy=False)
-            bit_chunks.append(chunk)
-            total_bits_seen += chunk.size
-
-            if required_bits is None and total_bits_seen >= _HEADER_BITS:
-                header_bits = np.concatenate(bit_chunks)[:_HEADER_BITS]
-                header_bytes = np.packbits(header_bits).tobytes()
-                payload_length = int.from_bytes(header_bytes, "big")
-                required_bits = _HEADER_BITS + payload_length * 8
-
-            if required_bits is not None and total_bits_seen >= required_bits:
-                break
+            flat = frame.reshape(-1)
+            if required_bits is None:
+                # The header almost always fits in the first frame; only then is the
+                # payload size known.
+                pending.append(flat & 1)
+                write_pos += flat.size
+                if write_pos >= _HEADER_BITS:
+                    seen = np.concatenate(pending)
+                    header = np.packbits(seen[:_HEADER_BITS]).tobytes()
+                    payload_length = int.from_bytes(header, "big")
+                    required_bits = _HEADER_BITS + payload_length * 8
+                    if frame_count > 0 and required_bits > frame_count * flat.size:
+                        cap.release()
+                        raise ValueError(
+                            "Embedded payload length exceeds video capacity"
+                        )
+                    # Size from the header, but never beyond what the video can hold,
+                    # so a corrupt length cannot trigger a huge allocation; the buffer
+                    # grows if the frame count was understated.
+                    frames_held = max(frame_count, len(pending))
+                    capacity = min(required_bits, frames_held * flat.size)
+                    bits = np.empty(max(capacity, seen.size), dtype=np.uint8)
+                    bits[: seen.size] = seen
+                continue
+            # ``bits`` is allocated in the same step that sets ``required_bits``.
+            assert bits is not None
+            take = min(flat.size, required_bits - write_pos)
+            if write_pos + take > bits.size:
+                size = min(required_bits, max(2 * bits.size, write_pos + take))
+                grown = np.empty(size, dtype=np.uint8)
+                grown[:write_pos] = bits[:write_pos]
+                bits = grown
+            np.bitwise_and(flat[:take], 1, out=bits[write_pos : write_pos + take])
+            write_pos += take
         cap.release()
 
-        if not bit_chunks:
+        if write_pos == 0:
             raise ValueError("Unable to read frames for extraction")
 
-        bits = np.concatenate(bit_chunks)
+        bits = bits[:write_pos] if bits is not None else np.concatenate(pending)
         header_bytes = np.packbits(bits[:_HEADER_BITS]).tobytes()
         payload_length = int.from_bytes(header_bytes, "big")
         payload_bit_count = payload_length * 8
         payload_bits = bits[_HEADER_BITS : _HEADER_BITS + payload_bit_count]
-        payload = _bits_to_bytes(payload_bits)
+        payload = bits_to_bytes(payload_bits)
 
         result = {
             "payload_length": payload_length,
@@ -215,14 +221,17 @@ class VideoFrameLSBDetector(Detector):
         cap = cv2.VideoCapture(stego_path)
         if not cap.isOpened():
             raise ValueError("Unable to open video")
+        limit_buffering(cap)
         variances = []
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
-            channel = frame[:, :, 0]
-            diff = channel & 1
-            variances.append(np.var(diff))
+            # LSBs are 0/1, so their variance is p - p^2 where p is the share of set
+            # bits across all channels.
+            ones = np.count_nonzero(frame & 1)
+            share = ones / frame.size
+            variances.append(share - share * share)
         cap.release()
         chi_metric = float(np.mean(variances)) if variances else 0.0
         probability = float(1 / (1 + math.exp(-(chi_metric - 0.25) * 10)))
@@ -0,0 +1,134 @@
+"""Threaded decode/encode stages shared by the video carriers."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Iterator, Tuple
+
+import cv2
+import numpy as np
+
+# Frames buffered between stages; bounds memory while letting decode and encode run
+# ahead of the caller.
+_QUEUE_DEPTH = 8
+_EOF = object()
+
+
+def open_writer(
+    output_path: str, fps: float, size: Tuple[int, int]
+) -> cv2.VideoWriter:
+    """Open an ``mp4v`` writer through FFmpeg.
+
+    OpenCV is allowed to pick a hardware encoder when one exists.
+    """
+
+    codec = cv2.VideoWriter_fourcc(*"mp4v")
+    # VIDEO_ACCELERATION_ANY falls back to software when no device is available;
+    # builds without FFmpeg or without the property reject the request outright, so
+    # retry with the default backend.
+    params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    writer = cv2.VideoWriter(output_path, cv2.CAP_FFMPEG, codec, fps, size, params)
+    if not writer.isOpened():
+        writer = cv2.VideoWriter(output_path, codec, fps, size)
+    return writer
+
+
+def limit_buffering(cap: cv2.VideoCapture) -> None:
+    """Ask the capture backend to hold a single frame.
+
+    This cuts latency on live or network sources.
+    """
+
+    # Backends without the property return False; a few raise instead. File inputs are
+    # unaffected either way.
+    try:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    except cv2.error:
+        pass
+
+
+class FrameReader:
+    """Iterate over the frames of ``cap`` while a background thread decodes ahead.
+
+    OpenCV releases the GIL inside ``read()``, so decoding overlaps the caller's
+    per-frame numpy work. Leaving the ``with`` block stops the decoder and releases
+    the capture.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        self._cap = cap
+        self._frames: queue.Queue[Any] = queue.Queue(maxsize=_QUEUE_DEPTH)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._decode, daemon=True)
+
+    def __enter__(self) -> FrameReader:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        # Unblock a decoder waiting on a full queue when the caller stopped early.
+        while self._thread.is_alive():
+            try:
+                self._frames.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        self._cap.release()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        while (item := self._frames.get()) is not _EOF:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _decode(self) -> None:
+        try:
+            while not self._stop.is_set():
+                ret, frame = self._cap.read()
+                if not ret:
+                    break
+                self._frames.put(frame)
+        except Exception as exc:  # noqa: BLE001 - re-raised on the consuming thread
+            self._frames.put(exc)
+        self._frames.put(_EOF)
+
+
+class FrameWriter:
+    """Hand frames to ``writer`` on a background thread.
+
+    Encoding then overlaps the next frame's work. Callers must not modify a frame
+    after passing it to :meth:`write`. Leaving the ``with`` block flushes the queue,
+    releases the writer and re-raises any encoding error.
+    """
+
+    def __init__(self, writer: cv2.VideoWriter) -> None:
+        self._writer = writer
+        self._frames: queue.Queue[Any] = queue.Queue(maxsize=_QUEUE_DEPTH)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._encode, daemon=True)
+
+    def __enter__(self) -> FrameWriter:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self._frames.put(_EOF)
+        self._thread.join()
+        self._writer.release()
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+    def write(self, frame: np.ndarray) -> None:
+        if self._error is not None:
+            raise self._error
+        self._frames.put(frame)
+
+    def _encode(self) -> None:
+        # Keep draining after a failure so ``write`` never blocks on a full queue.
+        while (frame := self._frames.get()) is not _EOF:
+            if self._error is None:
+                try:
+                    self._writer.write(frame)
+                except Exception as exc:  # noqa: BLE001 - re-raised on the producing thread
+                    self._error = exc
@@ -2,70 +2,104 @@
 
 from __future__ import annotations
 
+import importlib
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterable, Set, Tuple
 
 import click
 
 from ..core.config import get_settings
 from ..core.logging import configure_logging, log_operation
 from ..core.registry import registry
-from ..carriers.image import ImageLSBEmbedder, ImageLSBExtractor, ImageLSBDetector, ImageDCTEmbedder, ImageDCTExtractor, ImageDCTDetector
-from ..carriers.audio import AudioLSBEmbedder, AudioLSBExtractor, AudioLSBDetector, AudioEchoEmbedder, AudioEchoExtractor, AudioEchoDetector
-from ..carriers.video import VideoFrameLSBEmbedder, VideoFrameLSBExtractor, VideoFrameLSBDetector, VideoDWTEmbedder, VideoDWTExtractor, VideoDWTDetector
-from ..carriers.text import ZeroWidthEmbedder, ZeroWidthExtractor, ZeroWidthDetector, WhitespaceEmbedder, WhitespaceExtractor, WhitespaceDetector
-from ..carriers.network import NetworkHeaderEmbedder, NetworkHeaderExtractor, NetworkHeaderDetector, NetworkTimingEmbedder, NetworkTimingExtractor, NetworkTimingDetector
-from ..carriers.fs import AlternateStreamEmbedder, AlternateStreamExtractor, AlternateStreamDetector, SlackSpaceEmbedder, SlackSpaceExtractor, SlackSpaceDetector
-from ..watermark import WatermarkEmbedder, WatermarkExtractor, WatermarkDetector
-
-
-def _bootstrap_registry() -> None:
-    registry.register_embedder(ImageLSBEmbedder())
-    registry.register_extractor(ImageLSBExtractor())
-    registry.register_detector(ImageLSBDetector())
-    registry.register_embedder(ImageDCTEmbedder())
-    registry.register_extractor(ImageDCTExtractor())
-    registry.register_detector(ImageDCTDetector())
-
-    registry.register_embedder(AudioLSBEmbedder())
-    registry.register_extractor(AudioLSBExtractor())
-    registry.register_detector(AudioLSBDetector())
-    registry.register_embedder(AudioEchoEmbedder())
-    registry.register_extractor(AudioEchoExtractor())
-    registry.register_detector(AudioEchoDetector())
-
-    registry.register_embedder(VideoFrameLSBEmbedder())
-    registry.register_extractor(VideoFrameLSBExtractor())
-    registry.register_detector(VideoFrameLSBDetector())
-    registry.register_embedder(VideoDWTEmbedder())
-    registry.register_extractor(VideoDWTExtractor())
-    registry.register_detector(VideoDWTDetector())
-
-    registry.register_embedder(ZeroWidthEmbedder())
-    registry.register_extractor(ZeroWidthExtractor())
-    registry.register_detector(ZeroWidthDetector())
-    registry.register_embedder(WhitespaceEmbedder())
-    registry.register_extractor(WhitespaceExtractor())
-    registry.register_detector(WhitespaceDetector())
-
-    registry.register_embedder(NetworkHeaderEmbedder())
-    registry.register_extractor(NetworkHeaderExtractor())
-    registry.register_detector(NetworkHeaderDetector())
-    registry.register_embedder(NetworkTimingEmbedder())
-    registry.register_extractor(NetworkTimingExtractor())
-    registry.register_detector(NetworkTimingDetector())
-
-    registry.register_embedder(AlternateStreamEmbedder())
-    registry.register_extractor(AlternateStreamExtractor())
-    registry.register_detector(AlternateStreamDetector())
-    registry.register_embedder(SlackSpaceEmbedder())
-    registry.register_extractor(SlackSpaceExtractor())
-    registry.register_detector(SlackSpaceDetector())
-
-    registry.register_embedder(WatermarkEmbedder())
-    registry.register_extractor(WatermarkExtractor())
-    registry.register_detector(WatermarkDetector())
+
+
+# Carrier -> (package relative to ``stegresearch.cli``, (embedder, extractor, detector)
+# class names per method). Packages are imported on first use so a text or fs run never
+# loads cv2, pywt or scapy.
+_CARRIER_COMPONENTS: Dict[str, Tuple[str, Tuple[Tuple[str, str, str], ...]]] = {
+    "image": (
+        "..carriers.image",
+        (
+            ("ImageLSBEmbedder", "ImageLSBExtractor", "ImageLSBDetector"),
+            ("ImageDCTEmbedder", "ImageDCTExtractor", "ImageDCTDetector"),
+        ),
+    ),
+    "audio": (
+        "..carriers.audio",
+        (
+            ("AudioLSBEmbedder", "AudioLSBExtractor", "AudioLSBDetector"),
+            ("AudioEchoEmbedder", "AudioEchoExtractor", "AudioEchoDetector"),
+        ),
+    ),
+    "video": (
+        "..carriers.video",
+        (
+            (
+                "VideoFrameLSBEmbedder",
+                "VideoFrameLSBExtractor",
+                "VideoFrameLSBDetector",
+            ),
+            ("VideoDWTEmbedder", "VideoDWTExtractor", "VideoDWTDetector"),
+        ),
+    ),
+    "text": (
+        "..carriers.text",
+        (
+            ("ZeroWidthEmbedder", "ZeroWidthExtractor", "ZeroWidthDetector"),
+            ("WhitespaceEmbedder", "WhitespaceExtractor", "WhitespaceDetector"),
+        ),
+    ),
+    "network": (
+        "..carriers.network",
+        (
+            (
+                "NetworkHeaderEmbedder",
+                "NetworkHeaderExtractor",
+                "NetworkHeaderDetector",
+            ),
+            (
+                "NetworkTimingEmbedder",
+                "NetworkTimingExtractor",
+                "NetworkTimingDetector",
+            ),
+        ),
+    ),
+    "fs": (
+        "..carriers.fs",
+        (
+            (
+                "AlternateStreamEmbedder",
+                "AlternateStreamExtractor",
+                "AlternateStreamDetector",
+            ),
+            ("SlackSpaceEmbedder", "SlackSpaceExtractor", "SlackSpaceDetector"),
+        ),
+    ),
+    "watermark": (
+        "..watermark",
+        (("WatermarkEmbedder", "WatermarkExtractor", "WatermarkDetector"),),
+    ),
+}
+_registered_carriers: Set[str] = set()
+
+
+def _bootstrap_registry(carriers: Iterable[str] = tuple(_CARRIER_COMPONENTS)) -> None:
+    """Import and register the components of ``carriers``.
+
+    Carriers already registered in this process are skipped.
+    """
+
+    for carrier in carriers:
+        if carrier in _registered_carriers:
+            continue
+        package, components = _CARRIER_COMPONENTS[carrier]
+        module = importlib.import_module(package, __package__)
+        for embedder, extractor, detector in components:
+            registry.register_embedder(getattr(module, embedder)())
+            registry.register_extractor(getattr(module, extractor)())
+            registry.register_detector(getattr(module, detector)())
+        _registered_carriers.add(carrier)
 
 
 @click.group()
@@ -77,7 +111,6 @@ def cli(ctx: click.Context, config: Path | None) -> None:
     configure_logging()
     settings = get_settings()
     ctx.obj = {"settings": settings, "config": config}
-    _bootstrap_registry()
     log_operation("cli_start", config=str(config) if config else None)
 
 
@@ -93,12 +126,12 @@ def embed(carrier: str, method: str, cover: Path, payload: Path, output: Path, o
 
     opts: dict[str, Any] = json.loads(options)
     data = payload.read_bytes()
-    for embedder in registry.embedders(carrier):
-        if method in embedder.supported_methods():
-            metrics = embedder.embed(method, str(cover), data, str(output), **opts)
-            click.echo(json.dumps(metrics, indent=2))
-            return
-    raise click.ClickException(f"No embedder for carrier={carrier} method={method}")
+    _bootstrap_registry([carrier])
+    embedder = registry.embedder_for(carrier, method)
+    if embedder is None:
+        raise click.ClickException(f"No embedder for carrier={carrier} method={method}")
+    metrics = embedder.embed(method, str(cover), data, str(output), **opts)
+    click.echo(json.dumps(metrics, indent=2))
 
 
 @cli.command()
@@ -111,15 +144,18 @@ def extract(carrier: str, method: str, stego: Path, output: Path | None, options
     """Extract payload from stego carrier."""
 
     opts: dict[str, Any] = json.loads(options)
-    for extractor in registry.extractors(carrier):
-        if extractor.name == method.split("-")[0] or method in getattr(extractor, "supported_methods", lambda: [])():
-            result = extractor.extract(method, str(stego), **opts)
-            payload = result.get("payload", b"")
-            if output and payload:
-                output.write_bytes(payload)
-            click.echo(json.dumps({k: v for k, v in result.items() if k != "payload"}, indent=2))
-            return
-    raise click.ClickException(f"No extractor for carrier={carrier} method={method}")
+    _bootstrap_registry([carrier])
+    extractor = registry.extractor_for(carrier, method)
+    if extractor is None:
+        raise click.ClickException(
+            f"No extractor for carrier={carrier} method={method}"
+        )
+    result = extractor.extract(method, str(stego), **opts)
+    payload = result.get("payload", b"")
+    if output and payload:
+        output.write_bytes(payload)
+    summary = {k: v for k, v in result.items() if k != "payload"}
+    click.echo(json.dumps(summary, indent=2))
 
 
 @cli.command()
@@ -130,6 +166,7 @@ def detect(carrier: str, stego: Path, options: str) -> None:
     """Run steganalysis detectors."""
 
     opts: dict[str, Any] = json.loads(options)
+    _bootstrap_registry([carrier])
     detections = []
     for detector in registry.detectors(carrier):
         try:
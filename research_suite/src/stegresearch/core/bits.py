@@ -0,0 +1,42 @@
+"""Vectorized bit packing shared by the carriers."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+def bytes_to_bits(payload: bytes) -> np.ndarray:
+    """Unpack ``payload`` into a ``uint8`` array of bits, most significant bit first."""
+
+    if not payload:
+        return np.empty(0, dtype=np.uint8)
+    return np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+
+
+def bits_to_bytes(bits: Sequence[int] | np.ndarray) -> bytes:
+    """Pack MSB-first bits into bytes, dropping a trailing partial byte."""
+
+    if isinstance(bits, np.ndarray):
+        bit_array = bits.astype(np.uint8, copy=False)
+    else:
+        bit_array = np.fromiter(bits, dtype=np.uint8)
+
+    usable = bit_array.size - (bit_array.size % 8)
+    if usable == 0:
+        return b""
+    return np.packbits(bit_array[:usable]).tobytes()
+
+
+def bytes_to_bitstring(payload: bytes) -> str:
+    """Render ``payload`` as an MSB-first string of ``"0"``/``"1"`` characters."""
+
+    return (bytes_to_bits(payload) + np.uint8(ord("0"))).tobytes().decode("ascii")
+
+
+def bitstring_to_bytes(bitstring: str) -> bytes:
+    """Inverse of :func:`bytes_to_bitstring`, dropping a trailing partial byte."""
+
+    digits = np.frombuffer(bitstring.encode("ascii"), dtype=np.uint8)
+    return bits_to_bytes(digits - np.uint8(ord("0")))
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     default_seed: int = Field(default=1337)
     structured_logging: bool = Field(default=True)
     log_level: str = Field(default="INFO")
+    max_upload_bytes: int = Field(default=1 << 30)
 
     model_config = {
         "env_prefix": "STEG_",
@@ -28,9 +29,13 @@ class Settings(BaseSettings):
 
 
 @lru_cache(maxsize=1)
-def get_settings(overrides: Optional[dict[str, object]] = None) -> Settings:
-    """Return cached settings instance."""
+def get_settings() -> Settings:
+    """Return the cached settings instance built from the environment."""
 
-    if overrides:
-        return Settings(**overrides)
     return Settings()
+
+
+def build_settings(overrides: Mapping[str, Any]) -> Settings:
+    """Return fresh, validated settings with ``overrides`` over the environment."""
+
+    return Settings(**overrides)
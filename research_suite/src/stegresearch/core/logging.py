@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import Any
 
@@ -33,7 +34,15 @@ def configure_logging() -> None:
 
 
 def log_operation(event: str, **data: Any) -> None:
-    """Helper for structured operation logging."""
+    """Helper for structured operation logging.
 
+    Binary values such as recovered payloads are logged as a short SHA-256 digest
+    instead of being rendered.
+    """
+
+    for key, value in list(data.items()):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            del data[key]
+            data[f"{key}_sha256"] = hashlib.sha256(value).hexdigest()[:16]
     logger = structlog.get_logger("stegresearch")
     logger.info(event, **data)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional, TypeVar
+from typing import Dict, Iterable, Optional, Tuple, TypeVar
 
 from .interfaces import Capability, Detector, Embedder, Extractor
 
@@ -16,35 +16,77 @@ class ComponentRegistry:
         self._embedders: Dict[str, Embedder] = {}
         self._extractors: Dict[str, Extractor] = {}
         self._detectors: Dict[str, Detector] = {}
+        self._embedders_by_method: Dict[Tuple[str, str], Embedder] = {}
+        self._extractors_by_method: Dict[Tuple[str, str], Extractor] = {}
+        self._extractors_by_name: Dict[Tuple[str, str], Extractor] = {}
 
     def register_embedder(self, embedder: Embedder) -> None:
-        self._embedders[f"{embedder.carrier}:{embedder.name}"] = embedder
+        key = f"{embedder.carrier}:{embedder.name}"
+        self._embedders[key] = embedder
+        for method in embedder.supported_methods():
+            current = self._embedders_by_method.get((embedder.carrier, method))
+            # Earlier registrations win, matching a scan in registration order;
+            # re-registering replaces in place.
+            if current is None or f"{current.carrier}:{current.name}" == key:
+                self._embedders_by_method[(embedder.carrier, method)] = embedder
 
     def register_extractor(self, extractor: Extractor) -> None:
-        self._extractors[f"{extractor.carrier}:{extractor.name}"] = extractor
+        key = f"{extractor.carrier}:{extractor.name}"
+        self._extractors[key] = extractor
+        self._extractors_by_name[(extractor.carrier, extractor.name)] = extractor
+        # ``supported_methods`` is optional on the Extractor protocol.
+        methods = getattr(extractor, "supported_methods", lambda: [])()
+        for method in (extractor.name, *methods):
+            current = self._extractors_by_method.get((extractor.carrier, method))
+            if current is None or f"{current.carrier}:{current.name}" == key:
+                self._extractors_by_method[(extractor.carrier, method)] = extractor
 
     def register_detector(self, detector: Detector) -> None:
         self._detectors[f"{detector.carrier}:{detector.name}"] = detector
 
     def embedders(self, carrier: Optional[str] = None) -> Iterable[Embedder]:
+        prefix = f"{carrier}:"
         yield from (
             embedder
             for key, embedder in self._embedders.items()
-            if carrier is None or key.startswith(f"{carrier}:")
+            if carrier is None or key.startswith(prefix)
         )
 
+    def embedder_for(self, carrier: str, method: str) -> Optional[Embedder]:
+        """Return the embedder serving ``method`` for ``carrier`` without a scan."""
+
+        return self._embedders_by_method.get((carrier, method))
+
     def extractors(self, carrier: Optional[str] = None) -> Iterable[Extractor]:
+        prefix = f"{carrier}:"
         yield from (
             extractor
             for key, extractor in self._extractors.items()
-            if carrier is None or key.startswith(f"{carrier}:")
+            if carrier is None or key.startswith(prefix)
         )
 
+    def extractor_for(self, carrier: str, method: str) -> Optional[Extractor]:
+        """Return the extractor for ``method``, falling back to a name-prefix match."""
+
+        extractor = self._extractors_by_method.get((carrier, method))
+        if extractor is not None:
+            return extractor
+        # Variants such as ``dct-q50`` resolve to the extractor named by their longest
+        # prefix.
+        end = method.rfind("-")
+        while end > 0:
+            extractor = self._extractors_by_name.get((carrier, method[:end]))
+            if extractor is not None:
+                return extractor
+            end = method.rfind("-", 0, end)
+        return None
+
     def detectors(self, carrier: Optional[str] = None) -> Iterable[Detector]:
+        prefix = f"{carrier}:"
         yield from (
             detector
             for key, detector in self._detectors.items()
-            if carrier is None or key.startswith(f"{carrier}:")
+            if carrier is None or key.startswith(prefix)
         )
 
     def require_capability(
@@ -54,11 +96,13 @@ class ComponentRegistry:
     ) -> None:
         """Raise descriptive error when capability is missing."""
 
-        available = {
-            Capability.EMBED: any(self.embedders(carrier)),
-            Capability.EXTRACT: any(self.extractors(carrier)),
-            Capability.DETECT: any(self.detectors(carrier)),
-        }.get(capability, False)
+        # Only the requested kind is scanned, and ``any`` stops at its first match.
+        components = {
+            Capability.EMBED: self.embedders,
+            Capability.EXTRACT: self.extractors,
+            Capability.DETECT: self.detectors,
+        }.get(capability)
+        available = components is not None and any(components(carrier))
 
         if not available:
             raise ValueError(
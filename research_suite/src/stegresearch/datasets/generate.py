@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Deque, Iterable, Iterator, Tuple
 
 import click
 import numpy as np
@@ -14,28 +17,98 @@ from pydub.generators import Sine
 from ..core.config import get_settings
 from ..core.logging import log_operation
 
+# Below this many encode jobs, spawning worker processes costs more than it saves.
+_POOL_MIN_JOBS = 4
+
+
+class _InlineExecutor(Executor):
+    """Run each submitted call immediately in the calling process."""
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
 
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _generate_images(path: Path, count: int, seed: int) -> Iterable[Path]:
-    rng = np.random.default_rng(seed)
-    _ensure_dir(path)
-    for idx in range(count):
-        array = rng.integers(0, 255, size=(256, 256, 3), dtype=np.uint8)
-        output = path / f"image_{idx:04d}.png"
-        Image.fromarray(array).save(output)
-        yield output
+def _save_image(array: np.ndarray, output: Path) -> Path:
+    Image.fromarray(array).save(output)
+    return output
+
+
+def _export_tone(frequency: int, output: Path) -> Path:
+    Sine(frequency).to_audio_segment(duration=1000).export(output, format="wav")
+    return output
 
 
-def _generate_audio(path: Path, count: int, seed: int) -> Iterable[Path]:
+def _write_video(frames: np.ndarray, output: Path) -> Path:
+    import cv2  # local import avoids dependency for non-video users
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    writer = cv2.VideoWriter(str(output), fourcc, 24, (128, 128))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+    return output
+
+
+def _bounded_results(
+    executor: Executor,
+    calls: Iterable[Tuple[Callable[..., Path], Tuple[Any, ...]]],
+    window: int,
+) -> Iterator[Path]:
+    """Submit ``calls`` lazily, keeping at most ``window`` of them in flight.
+
+    Results are yielded in submission order. ``calls`` is only advanced when a slot
+    frees up, so the arrays it builds are not all held in memory at once.
+    """
+
+    pending: Deque[Future[Path]] = deque()
+    for fn, args in calls:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _generate_images(
+    path: Path, count: int, seed: int, executor: Executor, window: int
+) -> Iterable[Path]:
+    rng = np.random.default_rng(seed)
     _ensure_dir(path)
-    for idx in range(count):
-        tone = Sine(440 + idx * 10).to_audio_segment(duration=1000)
-        output = path / f"audio_{idx:04d}.wav"
-        tone.export(output, format="wav")
-        yield output
+    # Draws stay in the parent and in the original order so a seed keeps producing
+    # the same corpus; only PNG encoding and the write fan out to the workers.
+    calls = (
+        (
+            _save_image,
+            (
+                rng.integers(0, 255, size=(256, 256, 3), dtype=np.uint8),
+                path / f"image_{idx:04d}.png",
+            ),
+        )
+        for idx in range(count)
+    )
+    yield from _bounded_results(executor, calls, window)
+
+
+def _generate_audio(
+    path: Path, count: int, seed: int, executor: Executor, window: int
+) -> Iterable[Path]:
+    _ensure_dir(path)
+    calls = (
+        (_export_tone, (440 + idx * 10, path / f"audio_{idx:04d}.wav"))
+        for idx in range(count)
+    )
+    yield from _bounded_results(executor, calls, window)
 
 
 def _generate_text(path: Path, count: int, seed: int) -> Iterable[Path]:
@@ -43,26 +116,34 @@ def _generate_text(path: Path, count: int, seed: int) -> Iterable[Path]:
     vocab = ["research", "analysis", "steganography", "forensics", "lawful", "sandbox"]
     _ensure_dir(path)
     for idx in range(count):
-        words = rng.choice(vocab, size=200)
+        # Same draws as rng.choice(vocab, ...), without building a numpy string array
+        # to join.
+        words = [vocab[i] for i in rng.integers(0, len(vocab), size=200)]
         output = path / f"text_{idx:04d}.txt"
         output.write_text(" ".join(words))
         yield output
 
 
-def _generate_video(path: Path, count: int, seed: int) -> Iterable[Path]:
-    import cv2  # local import avoids dependency for non-video users
+def _random_frames(rng: np.random.Generator) -> np.ndarray:
+    # One draw per frame: a single (60, 128, 128, 3) draw consumes the bit stream
+    # differently and would change every seed's videos. Filling in place still
+    # avoids a list of frames plus a stacked copy.
+    frames = np.empty((60, 128, 128, 3), dtype=np.uint8)
+    for frame in frames:
+        frame[...] = rng.integers(0, 255, size=frame.shape, dtype=np.uint8)
+    return frames
+
 
+def _generate_video(
+    path: Path, count: int, seed: int, executor: Executor, window: int
+) -> Iterable[Path]:
     rng = np.random.default_rng(seed)
     _ensure_dir(path)
-    for idx in range(count):
-        output = path / f"video_{idx:04d}.mp4"
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        writer = cv2.VideoWriter(str(output), fourcc, 24, (128, 128))
-        for frame_idx in range(60):
-            frame = rng.integers(0, 255, size=(128, 128, 3), dtype=np.uint8)
-            writer.write(frame)
-        writer.release()
-        yield output
+    calls = (
+        (_write_video, (_random_frames(rng), path / f"video_{idx:04d}.mp4"))
+        for idx in range(count)
+    )
+    yield from _bounded_results(executor, calls, window)
 
 
 @click.command()
@@ -97,12 +178,35 @@ def main(
         "text": [],
     }
 
-    if generate_all or images > 0:
-        manifest["images"] = [str(path) for path in _generate_images(output / "images", images, seed)]
-    if generate_all or audio_count > 0:
-        manifest["audio"] = [str(path) for path in _generate_audio(output / "audio", audio_count, seed)]
-    if generate_all or video_count > 0:
-        manifest["video"] = [str(path) for path in _generate_video(output / "video", video_count, seed)]
+    # Encoding dominates and the items are independent, so spread it over processes
+    # when there is enough of it; paths come back in submission order either way,
+    # keeping the manifest stable. Two jobs per worker keep the pool busy while
+    # bounding how many generated arrays wait in memory.
+    jobs = max(images, 0) + max(audio_count, 0) + max(video_count, 0)
+    workers = min(os.cpu_count() or 1, jobs)
+    executor: Executor
+    if jobs >= _POOL_MIN_JOBS and workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        window = 2 * workers
+    else:
+        executor = _InlineExecutor()
+        window = 1
+    with executor:
+        if generate_all or images > 0:
+            paths = _generate_images(
+                output / "images", images, seed, executor, window
+            )
+            manifest["images"] = [str(path) for path in paths]
+        if generate_all or audio_count > 0:
+            paths = _generate_audio(
+                output / "audio", audio_count, seed, executor, window
+            )
+            manifest["audio"] = [str(path) for path in paths]
+        if generate_all or video_count > 0:
+            paths = _generate_video(
+                output / "video", video_count, seed, executor, window
+            )
+            manifest["video"] = [str(path) for path in paths]
     if generate_all or text_count > 0:
         manifest["text"] = [str(path) for path in _generate_text(output / "text", text_count, seed)]
 
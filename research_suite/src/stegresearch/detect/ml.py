@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple, cast
 
 import joblib
 import numpy as np
 from PIL import Image
+from sklearn.base import clone
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import train_test_split
@@ -17,37 +20,102 @@ from ..core.interfaces import Detector
 from ..core.logging import log_operation
 
 _MODEL_PATH = Path("artifacts/ml_detector.joblib")
+_FEATURE_CACHE = joblib.Memory(Path("artifacts/feature_cache"), verbose=0)
+# joblib keys the feature cache on the cached function's own source only; bump this
+# whenever _extract_features changes so stale entries are not served.
+_FEATURE_VERSION = 1
 
 
 def _extract_features(image_path: Path) -> np.ndarray:
     with Image.open(image_path) as image:
-        data = np.array(image.convert("L"))
-    hist, _ = np.histogram(data, bins=64, range=(0, 256), density=True)
-    diff = np.diff(data.astype(np.int16), axis=1)
-    coefs = np.histogram(diff, bins=32, range=(-32, 32), density=True)[0]
+        data = np.asarray(image.convert("L"))
+    # Integer bincounts reproduce np.histogram(..., density=True) bit for bit:
+    # counts / bin width / total.
+    counts = np.bincount(data.ravel() >> 2, minlength=64)
+    hist = counts / 4 / counts.sum()
+    diff = np.diff(data.astype(np.int16), axis=1).ravel()
+    # Count every possible difference (-255..255), then fold [-32, 32] into width-2
+    # bins; as with np.histogram, +32 lands in the last bin and anything outside the
+    # range is dropped.
+    spread = np.bincount(diff + 255, minlength=511)
+    counts = spread[223:287].reshape(32, 2).sum(axis=1)
+    counts[-1] += spread[287]
+    coefs = counts / 2 / counts.sum()
     return np.concatenate([hist, coefs])
 
 
+def _compute_features(
+    image_path: str, mtime_ns: int, size: int, version: int
+) -> np.ndarray:
+    """Uncached body of :func:`_cached_features`.
+
+    ``mtime_ns``, ``size`` and ``version`` only key the cache, so edited images and
+    feature code changes are re-extracted.
+    """
+
+    return _extract_features(Path(image_path))
+
+
+_cached_features = cast(
+    Callable[[str, int, int, int], np.ndarray], _FEATURE_CACHE.cache(_compute_features)
+)
+
+
+def _training_features(image_path: Path) -> np.ndarray:
+    stat = image_path.stat()
+    return _cached_features(
+        str(image_path.resolve()), stat.st_mtime_ns, stat.st_size, _FEATURE_VERSION
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_model(mtime_ns: int, size: int) -> LogisticRegression:
+    """Load the persisted model once per process.
+
+    ``mtime_ns`` and ``size`` key the cache, so a refit model is reloaded.
+    """
+
+    # Uncompressed protocol-5 pickles let the coefficient arrays map straight from disk.
+    return joblib.load(_MODEL_PATH, mmap_mode="r")
+
+
 @dataclass
 class MLDetector(Detector):
     name: str = "ml-baseline"
     carrier: str = "image"
 
     def __post_init__(self) -> None:
-        _MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-        if _MODEL_PATH.exists():
-            self.model = joblib.load(_MODEL_PATH)
-        else:
+        try:
+            stat = _MODEL_PATH.stat()
+        except FileNotFoundError:
             self.model = LogisticRegression(max_iter=200)
+        else:
+            self.model = _load_model(stat.st_mtime_ns, stat.st_size)
 
-    def fit(self, cover_paths: Tuple[Path, ...], stego_paths: Tuple[Path, ...]) -> Dict[str, Any]:
-        X = np.vstack([_extract_features(path) for path in (*cover_paths, *stego_paths)])
+    def fit(
+        self, cover_paths: Tuple[Path, ...], stego_paths: Tuple[Path, ...]
+    ) -> Dict[str, Any]:
+        # Refits over an overlapping corpus reuse cached vectors; cold extraction runs
+        # on threads since PIL decoding releases the GIL.
+        features = joblib.Parallel(n_jobs=-1, prefer="threads")(
+            joblib.delayed(_training_features)(path)
+            for path in (*cover_paths, *stego_paths)
+        )
+        X = np.vstack(features)
         y = np.array([0] * len(cover_paths) + [1] * len(stego_paths))
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+        # Other detectors in the process may share the cached model, so fit a fresh
+        # copy rather than mutate it.
+        self.model = clone(self.model)
         self.model.fit(X_train, y_train)
         probs = self.model.predict_proba(X_test)[:, 1]
         auc = roc_auc_score(y_test, probs)
-        joblib.dump(self.model, _MODEL_PATH)
+        # Write beside the model and swap it in: truncating a file another detector
+        # has mapped would fault it.
+        _MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+        staging = _MODEL_PATH.with_suffix(".tmp")
+        joblib.dump(self.model, staging, compress=False, protocol=5)
+        os.replace(staging, _MODEL_PATH)
         metrics = {
             "roc_auc": float(auc),
             "samples": int(len(X)),
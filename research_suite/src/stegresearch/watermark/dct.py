@@ -8,11 +8,42 @@ from typing import Any, Dict, Iterable
 
 import cv2
 import numpy as np
+from PIL import Image
 
 from ..core.interfaces import Detector, Embedder, Extractor
 from ..core.logging import log_operation
 from ..core.metrics import image_arrays, psnr, ssim
 
+_BLOCK = 8
+# Formats cv2.imwrite stores losslessly, so reading the stego back would return the
+# array just written.
+_LOSSLESS_SUFFIXES = frozenset({".png", ".bmp", ".tif", ".tiff"})
+
+
+def _dct_rows(n: int) -> np.ndarray:
+    """Return the first ``_BLOCK`` rows of the orthonormal ``n``-point DCT-II matrix.
+
+    Rows are scaled the way ``cv2.dct`` scales them.
+    """
+
+    k = np.arange(min(_BLOCK, n))[:, None]
+    basis = np.cos(np.pi * (2 * np.arange(n) + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    basis[0] /= np.sqrt(2)
+    return basis
+
+
+def _low_frequency_block(image: np.ndarray) -> np.ndarray:
+    """Return the top-left block of ``cv2.dct(image)`` without a full transform.
+
+    The embedder works on the full-image DCT, so the block is projected onto the
+    leading basis rows of each axis: two thin matrix products instead of an N-by-N
+    transform.
+    """
+
+    rows, cols = image.shape
+    block = _dct_rows(rows) @ image.astype(np.float64) @ _dct_rows(cols).T
+    return block.astype(np.float32)
+
 
 @dataclass
 class WatermarkEmbedder(Embedder):
@@ -30,16 +61,25 @@ class WatermarkEmbedder(Embedder):
         image = cv2.imread(carrier_path, cv2.IMREAD_GRAYSCALE)
         if image is None:
             raise ValueError("Unable to read image")
-        watermark_id = np.array(list(payload[:64]), dtype=np.uint8)
+        watermark_id = np.frombuffer(payload[:64], dtype=np.uint8)
         watermark_id = np.resize(watermark_id, (8, 8))
         dct = cv2.dct(image.astype(np.float32))
         strength = float(options.get("strength", 10.0))
         dct[:8, :8] += watermark_id * strength
         reconstructed = cv2.idct(dct)
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        cv2.imwrite(output_path, np.clip(reconstructed, 0, 255).astype(np.uint8))
-
-        original, stego = image_arrays(Path(carrier_path), Path(output_path))
+        stego_gray = np.clip(reconstructed, 0, 255).astype(np.uint8)
+        cv2.imwrite(output_path, stego_gray)
+
+        if Path(output_path).suffix.lower() in _LOSSLESS_SUFFIXES:
+            # The file decodes to exactly ``stego_gray``, and as RGB that is the plane
+            # repeated; only the cover, which may be in colour, has to come back from
+            # disk.
+            with Image.open(carrier_path) as cover:
+                original = np.asarray(cover.convert("RGB"))
+            stego = np.repeat(stego_gray[:, :, None], 3, axis=2)
+        else:
+            original, stego = image_arrays(Path(carrier_path), Path(output_path))
         metrics = {
             "psnr": psnr(original, stego),
             "ssim": ssim(original, stego),
@@ -63,10 +103,9 @@ class WatermarkExtractor(Extractor):
         image = cv2.imread(stego_path, cv2.IMREAD_GRAYSCALE)
         if image is None:
             raise ValueError("Unable to read image")
-        dct = cv2.dct(image.astype(np.float32))
         strength = float(options.get("strength", 10.0))
-        block = np.round(dct[:8, :8] / strength).astype(np.uint8)
-        payload = bytes(block.flatten().tolist())
+        block = np.round(_low_frequency_block(image) / strength).astype(np.uint8)
+        payload = block.tobytes()
         result = {
             "payload": payload,
             "payload_length": len(payload),
@@ -84,9 +123,8 @@ class WatermarkDetector(Detector):
         image = cv2.imread(stego_path, cv2.IMREAD_GRAYSCALE)
         if image is None:
             raise ValueError("Unable to read image")
-        dct = cv2.dct(image.astype(np.float32))
         strength = float(options.get("strength", 10.0))
-        block = np.round(dct[:8, :8] / strength)
+        block = np.round(_low_frequency_block(image) / strength)
         energy = float(np.linalg.norm(block))
         probability = float(min(1.0, energy / 100))
         result = {
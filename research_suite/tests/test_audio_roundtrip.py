@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 import soundfile as sf
 
 from stegresearch.carriers.audio import AudioLSBEmbedder, AudioLSBExtractor
@@ -22,3 +23,24 @@ def test_audio_lsb_roundtrip(tmp_path: Path) -> None:
     extractor = AudioLSBExtractor()
     result = extractor.extract("pcm-lsb", str(stego))
     assert result["payload"].startswith(payload)
+
+
+def test_audio_lsb_header_and_capacity(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    cover = tmp_path / "cover.wav"
+    samples = rng.integers(-2000, 2000, size=4000, dtype=np.int16)
+    sf.write(cover, samples, 8000, subtype="PCM_16")
+
+    # A 4-byte big-endian length header leaves 4000 // 8 - 4 bytes of capacity.
+    payload = rng.integers(0, 256, size=496, dtype=np.uint8).tobytes()
+    stego = tmp_path / "stego.wav"
+    AudioLSBEmbedder().embed("pcm-lsb", str(cover), payload, str(stego))
+
+    samples, _ = sf.read(stego, dtype="int16")
+    header = np.packbits(samples[:32] & 1).tobytes()
+    assert header == len(payload).to_bytes(4, "big")
+    result = AudioLSBExtractor().extract("pcm-lsb", str(stego))
+    assert result["payload"] == payload
+
+    with pytest.raises(ValueError):
+        AudioLSBEmbedder().embed("pcm-lsb", str(cover), payload + b"x", str(stego))
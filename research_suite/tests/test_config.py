@@ -0,0 +1,15 @@
+from pathlib import Path
+
+from stegresearch.core.config import build_settings, get_settings
+
+
+def test_build_settings_applies_dict_overrides() -> None:
+    # A plain dict is unhashable; passing it through the cached getter raised TypeError.
+    overrides = {"default_seed": 7, "artifact_dir": "out"}
+    settings = build_settings(overrides)
+
+    assert settings.default_seed == 7
+    assert settings.artifact_dir == Path("out")
+    assert build_settings(overrides) is not settings
+    assert get_settings() is get_settings()
+    assert get_settings().default_seed == 1337
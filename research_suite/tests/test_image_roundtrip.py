@@ -3,7 +3,12 @@ from pathlib import Path
 import numpy as np
 from PIL import Image
 
-from stegresearch.carriers.image import ImageLSBEmbedder, ImageLSBExtractor
+from stegresearch.carriers.image import (
+    ImageDCTDetector,
+    ImageDCTEmbedder,
+    ImageLSBEmbedder,
+    ImageLSBExtractor,
+)
 
 
 def test_image_lsb_roundtrip(tmp_path: Path) -> None:
@@ -19,3 +24,26 @@ def test_image_lsb_roundtrip(tmp_path: Path) -> None:
     extractor = ImageLSBExtractor()
     result = extractor.extract("rgb-lsb", str(stego))
     assert result["payload"] == payload
+
+
+def test_image_dct_counts_ragged_edge_blocks(tmp_path: Path) -> None:
+    # 20x20 holds four full blocks (20 bits) but nine once the partial edges count
+    # (45 bits), enough for the 32-bit header plus one byte as before.
+    cover = tmp_path / "cover.png"
+    rng = np.random.default_rng(0)
+    Image.fromarray(rng.integers(0, 255, size=(20, 20, 3), dtype=np.uint8)).save(cover)
+
+    metrics = ImageDCTEmbedder().embed(
+        "dct-midband", str(cover), b"x", str(tmp_path / "stego.png")
+    )
+    assert metrics["capacity_bits"] == 40
+
+
+def test_image_dct_detector_scores_images_smaller_than_a_block(tmp_path: Path) -> None:
+    image = tmp_path / "tiny.png"
+    rng = np.random.default_rng(0)
+    Image.fromarray(rng.integers(0, 255, size=(6, 6, 3), dtype=np.uint8)).save(image)
+
+    result = ImageDCTDetector().detect(str(image))
+    assert np.isfinite(result["variance"])
+    assert 0.0 <= result["probability"] <= 1.0
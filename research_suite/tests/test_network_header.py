@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+from scapy.all import ARP, IP, TCP, Ether, IPv6, raw, rdpcap, wrpcap
+
+from stegresearch.carriers.network import (
+    NetworkHeaderEmbedder,
+    NetworkHeaderExtractor,
+    header,
+)
+
+
+def _carrier(linktype: int) -> list:
+    packets = [IP(dst="127.0.0.1", id=idx * 7) / TCP(dport=80) for idx in range(64)]
+    if linktype == 1:
+        packets = [Ether() / packet for packet in packets]
+        packets.insert(3, Ether() / ARP())
+    else:
+        packets.insert(3, IPv6() / TCP())
+    return packets
+
+
+@pytest.mark.parametrize("linktype", [1, 101, 228])
+def test_pcap_fast_path_matches_scapy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, linktype: int
+) -> None:
+    cover = tmp_path / "cover.pcap"
+    wrpcap(str(cover), _carrier(linktype), linktype=linktype)
+    payload = b"id"
+
+    fast = tmp_path / "fast.pcap"
+    NetworkHeaderEmbedder().embed("ip-id-lsb", str(cover), payload, str(fast))
+    monkeypatch.setattr(header, "_patch_pcap_ip_ids", lambda data, bits: None)
+    slow = tmp_path / "slow.pcap"
+    NetworkHeaderEmbedder().embed("ip-id-lsb", str(cover), payload, str(slow))
+
+    fast_packets, slow_packets = rdpcap(str(fast)), rdpcap(str(slow))
+    assert len(fast_packets) == len(slow_packets) == 65
+    for fast_packet, slow_packet in zip(fast_packets, slow_packets):
+        if IP in slow_packet and slow_packet[IP].version == 4:
+            assert fast_packet[IP].id == slow_packet[IP].id
+            assert fast_packet[IP].chksum == slow_packet[IP].chksum
+        else:
+            assert raw(fast_packet) == raw(slow_packet)
+    result = NetworkHeaderExtractor().extract("ip-id-lsb", str(fast))
+    assert result["payload"] == payload
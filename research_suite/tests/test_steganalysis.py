@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from stegresearch.carriers.image import ImageLSBDetector, ImageLSBEmbedder
+from stegresearch.detect import ChiSquareDetector, RSAnalysisDetector
+
+
+def _gray_png(path: Path, values: np.ndarray) -> str:
+    Image.fromarray(np.stack([values.astype(np.uint8)] * 3, axis=-1)).save(path)
+    return str(path)
+
+
+def test_chi_square_pairs_adjacent_values(tmp_path: Path) -> None:
+    # Pairs (0, 1) and (2, 3) are 3:1 and 1:3 splits around an expected count of 2, each
+    # contributing (1 + 1) / 2; the balanced (10, 11) pair contributes nothing.
+    values = np.array([[0, 0, 0, 1, 2, 3], [3, 3, 10, 10, 11, 11]])
+    image = _gray_png(tmp_path / "pairs.png", values)
+
+    assert ImageLSBDetector().detect(image)["chi_square"] == pytest.approx(2.0)
+    assert ChiSquareDetector().detect(image)["chi_square"] == pytest.approx(2.0)
+
+
+def test_rs_residuals_rise_with_lsb_embedding(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:128, 0:128]
+    covers = {
+        "flat": np.full((128, 128), 100),
+        "smooth": np.sin(x / 9) * 60 + np.cos(y / 7) * 60 + 128,
+    }
+    detector = RSAnalysisDetector()
+    for name, values in covers.items():
+        cover = _gray_png(tmp_path / f"{name}.png", values)
+        stego = str(tmp_path / f"{name}_stego.png")
+        payload = rng.integers(0, 256, size=3000, dtype=np.uint8).tobytes()
+        ImageLSBEmbedder().embed("rgb-lsb", cover, payload, stego)
+
+        clean, marked = detector.detect(cover), detector.detect(stego)
+        if name == "flat":
+            # Reflected borders keep a constant image's Laplacian at exactly zero.
+            assert clean["residual_r"] == clean["residual_s"] == 0.0
+        assert marked["residual_r"] > clean["residual_r"]
+        assert marked["residual_s"] > clean["residual_s"]
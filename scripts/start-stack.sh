@@ -5,6 +5,11 @@ ROOT_DIR=$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)
 PYTHON_BIN=${PYTHON_BIN:-"${ROOT_DIR}/.venv/bin/python"}
 BACKEND_HOST=${BACKEND_HOST:-127.0.0.1}
 BACKEND_PORT=${BACKEND_PORT:-8000}
+# Each backend worker is a separate process with its own derived-key cache, so more
+# workers add parallelism at the cost of memory and of repeating PBKDF2 derivations
+# that another worker already cached. Raise BACKEND_WORKERS (up to the core count)
+# for throughput-bound deployments.
+BACKEND_WORKERS=${BACKEND_WORKERS:-1}
 RESEARCH_PORT=${RESEARCH_PORT:-8100}
 FRONTEND_HOST=${FRONTEND_HOST:-127.0.0.1}
 FRONTEND_PORT=${FRONTEND_PORT:-5173}
@@ -43,7 +48,9 @@ trap cleanup INT TERM EXIT
 
 (
   cd "${ROOT_DIR}/backend"
-  "${PYTHON_BIN}" -m uvicorn app.main:app --host "${BACKEND_HOST}" --port "${BACKEND_PORT}"
+  # uvloop and httptools ship with uvicorn[standard]; pin them so a missing extra fails loudly.
+  "${PYTHON_BIN}" -m uvicorn app.main:app --host "${BACKEND_HOST}" --port "${BACKEND_PORT}" \
+    --loop uvloop --http httptools --workers "${BACKEND_WORKERS}"
 ) &
 BACKEND_PID=$!
 echo "[stack] backend listening on http://${BACKEND_HOST}:${BACKEND_PORT}" >&2